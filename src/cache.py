@@ -0,0 +1,216 @@
+"""
+On-disk cache for LLM responses and search results.
+
+LLM entries are content-addressed by (model, temperature, prompt), so re-running
+the agent on an identical request short-circuits the LLM call entirely. Search
+results are keyed on the normalized query and expire after a TTL.
+
+Expired entries are deleted when read. A namespace can also be given a size cap,
+past which its oldest entries are deleted.
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage
+from langchain_core.runnables import Runnable
+from pydantic import BaseModel, ValidationError
+
+# Bytes stored per capped namespace directory, measured once per process
+_sizes: dict[Path, int] = {}
+_sizes_lock = threading.Lock()
+
+
+class DiskCache:
+    """
+    Key/value store with one file per entry under `<root>/<namespace>/`.
+
+    With `max_bytes`, writes that push the namespace past the cap delete the
+    least recently written entries until it is back under 90% of it.
+    """
+
+    def __init__(self, namespace: str, root: str, max_bytes: int | None = None):
+        self.path = Path(root).expanduser() / namespace
+        self.max_bytes = max_bytes
+
+    def get(self, key: str, max_age: float | None = None) -> str | None:
+        """Return the cached value, or None on a miss or if older than `max_age` seconds."""
+        path = self.path / f"{key}.json"
+        try:
+            if max_age is not None:
+                stat = path.stat()
+                if time.time() - stat.st_mtime > max_age:
+                    path.unlink(missing_ok=True)  # Expired: free the space rather than keep skipping it
+                    self._account(-stat.st_size)
+                    return None
+            return path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    def set(self, key: str, value: str) -> None:
+        """Store a value atomically (write to a temp file, then rename)."""
+        path = self.path / f"{key}.json"
+        try:
+            replaced = path.stat().st_size if self.max_bytes is not None and path.exists() else 0
+            self.path.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(value)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            # A read-only or full disk shouldn't fail the research run
+            print(f"[Cache] Could not write {self.path.name}/{key}: {e}")
+            return
+
+        if self.max_bytes is not None:
+            # Overwriting an entry only grows the namespace by the difference
+            self._enforce_cap(len(value.encode()) - replaced)
+
+    def _account(self, delta: int) -> None:
+        """Adjust the tracked namespace size (only tracked once a capped write measured it)."""
+        with _sizes_lock:
+            if self.path in _sizes:
+                _sizes[self.path] += delta
+
+    def _enforce_cap(self, added: int) -> None:
+        """Account for a write and evict the oldest entries if over `max_bytes`."""
+        with _sizes_lock:
+            if self.path not in _sizes:
+                _sizes[self.path] = sum(e.stat().st_size for e in self._entries())
+            else:
+                _sizes[self.path] += added
+            if _sizes[self.path] <= self.max_bytes:
+                return
+
+            entries = sorted(self._entries(), key=lambda e: e.stat().st_mtime)
+            size = sum(e.stat().st_size for e in entries)
+            target = self.max_bytes * 0.9
+            for entry in entries:
+                if size <= target:
+                    break
+                try:
+                    os.unlink(entry.path)
+                    size -= entry.stat().st_size
+                except OSError:
+                    continue
+            _sizes[self.path] = size
+            print(f"[Cache] Pruned {self.path.name} to {size // 1_000_000} MB")
+
+    def _entries(self) -> list[os.DirEntry]:
+        try:
+            return [e for e in os.scandir(self.path) if e.name.endswith(".json")]
+        except OSError:
+            return []
+
+
+_QUERY_TOKEN_RE = re.compile(r"\w+")
+
+
+def query_key(query: str, *params: object) -> str:
+    """
+    Cache key for a search query.
+
+    The query is reduced to its set of lowercase word tokens, so reorderings,
+    casing and punctuation changes of the same terms share an entry while any
+    change of terms (names, years, ...) still misses.
+    """
+    normalized = " ".join(sorted(set(_QUERY_TOKEN_RE.findall(query.lower()))))
+    payload = "|".join([normalized, *map(str, params)])
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def prompt_hash(model: str, temperature: float, messages: list[BaseMessage]) -> str:
+    """Hash the model settings and message contents into a cache key."""
+    payload = json.dumps([m.content for m in messages])
+    return hashlib.sha256(f"{model}|{temperature}|{payload}".encode()).hexdigest()
+
+
+def cached_invoke(
+    cache: DiskCache | None,
+    llm: BaseChatModel,
+    messages: list[BaseMessage],
+    schema: type[BaseModel] | None = None,
+    structured_llm: Runnable | None = None,
+) -> BaseModel | str:
+    """
+    Invoke the LLM, serving repeated prompts from the cache.
+
+    Args:
+        cache: Cache to consult, or None to always call the LLM
+        llm: Chat model to call on a miss
+        messages: Prompt messages
+        schema: Pydantic model for structured output; if None, returns the text content
+        structured_llm: Prebuilt `llm.with_structured_output(schema)` to reuse across calls
+
+    Returns:
+        Parsed `schema` instance, or the response text
+    """
+    key, hit = _lookup(cache, llm, messages, schema)
+    if hit is not None:
+        return hit
+
+    if schema is not None:
+        structured_llm = structured_llm or llm.with_structured_output(schema)
+        result = structured_llm.invoke(messages)
+        serialized = result.model_dump_json()
+    else:
+        result = llm.invoke(messages).content
+        serialized = json.dumps(result)
+
+    if cache is not None:
+        cache.set(key, serialized)
+    return result
+
+
+async def acached_invoke(
+    cache: DiskCache | None,
+    llm: BaseChatModel,
+    messages: list[BaseMessage],
+    schema: type[BaseModel] | None = None,
+    structured_llm: Runnable | None = None,
+) -> BaseModel | str:
+    """Async variant of cached_invoke."""
+    key, hit = _lookup(cache, llm, messages, schema)
+    if hit is not None:
+        return hit
+
+    if schema is not None:
+        structured_llm = structured_llm or llm.with_structured_output(schema)
+        result = await structured_llm.ainvoke(messages)
+        serialized = result.model_dump_json()
+    else:
+        result = (await llm.ainvoke(messages)).content
+        serialized = json.dumps(result)
+
+    if cache is not None:
+        cache.set(key, serialized)
+    return result
+
+
+def _lookup(
+    cache: DiskCache | None,
+    llm: BaseChatModel,
+    messages: list[BaseMessage],
+    schema: type[BaseModel] | None,
+) -> tuple[str | None, BaseModel | str | None]:
+    """Return (key, cached result) for a prompt; both None when caching is off."""
+    if cache is None:
+        return None, None
+    key = prompt_hash(llm.model_name, llm.temperature, messages)
+    if schema is not None:
+        key = f"{schema.__name__}_{key}"
+    hit = cache.get(key)
+    if hit is None:
+        return key, None
+    try:
+        return key, schema.model_validate_json(hit) if schema is not None else json.loads(hit)
+    except (ValidationError, ValueError):
+        # Written under an older schema (or truncated): treat as a miss and overwrite
+        return key, None
@@ -6,16 +6,86 @@ Two-step process:
 2. Generate sections with specific, non-overlapping content guidance
 """
 
+import asyncio
+import json
 import re
+from collections import Counter
+from typing import TYPE_CHECKING, Literal
 
-from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
 from langchain_core.runnables import RunnableConfig
-from langchain_openai import ChatOpenAI
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
+from .cache import DiskCache, acached_invoke, cached_invoke
 from .config import AgentConfig, get_config
-from .prompts import get_current_date_context
-from .state import ReportPreferences, ResearchPlan, ResearchState, SourceMetadata
+from .llm_pool import get_llm, get_structured_llm, run_async
+from .prompts import (
+    COMPILER_PLAN_STATIC_HEADER,
+    COMPILER_SECTION_STATIC_HEADER,
+    get_current_date_context,
+)
+from .semcache import findings_digest, get_section_cache
+from .state import ReportPreferences, ResearchPlan, ResearchState, SourceMetadata, as_research_plan
+
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+
+MAX_CONCURRENT_SECTIONS = 8  # Concurrent section LLM calls (OpenAI rate limits)
+
+_CITE_RE = re.compile(r"\[(src_[a-zA-Z0-9]+)\]")
+_NUM_CITE_RE = re.compile(r"\[(\d+(?:\s*,\s*\d+)*)\]")
+_REFS_RE = re.compile(r"\n+##?\s*References?\s*\n.*", re.DOTALL | re.IGNORECASE)
+_WORD_RE = re.compile(r"\w+")
+_DEEP_SECTION_RE = re.compile(r"synthesis|conclusion|deep[- ]dive", re.IGNORECASE)
+
+_AUDIENCE_GUIDANCE: dict[str, str] = {
+    "student": "Write clearly, explain concepts, educational tone.",
+    "expert": "Assume domain knowledge, focus on nuance and advanced analysis.",
+    "professional": "Business-appropriate, actionable insights.",
+    "general": "Balanced, accessible, engaging.",
+}
+
+
+def _dedup_findings(text: str, threshold: float = 0.8) -> str:
+    """
+    Drop paragraphs that near-duplicate an earlier paragraph.
+
+    Paragraphs are compared by Jaccard similarity of their word 5-gram shingles,
+    using an inverted index so only paragraphs sharing a shingle are compared.
+    Short paragraphs (headings, one-liners) are always kept for structure.
+    """
+    kept: list[str] = []
+    sizes: list[int] = []  # Shingle count per indexed paragraph
+    index: dict[str, list[int]] = {}  # Shingle -> indexed paragraphs containing it
+
+    for paragraph in text.split("\n\n"):
+        words = _WORD_RE.findall(paragraph.lower())
+        if len(words) < 12:
+            kept.append(paragraph)
+            continue
+
+        shingles = {" ".join(words[i:i + 5]) for i in range(len(words) - 4)}
+        overlap = Counter(j for sh in shingles for j in index.get(sh, ()))
+        if any(n / (len(shingles) + sizes[j] - n) >= threshold for j, n in overlap.items()):
+            continue
+
+        for sh in shingles:
+            index.setdefault(sh, []).append(len(sizes))
+        sizes.append(len(shingles))
+        kept.append(paragraph)
+
+    return "\n\n".join(kept)
+
+
+def _number_sources(sources: list[SourceMetadata]) -> dict[str, int]:
+    """Citation number for each source id, in source order."""
+    return {s.id: i for i, s in enumerate(sources, 1)}
+
+
+def _renumber_citations(text: str, id_to_num: dict[str, int]) -> str:
+    """Rewrite [src_xxx] citations as [N]; ids without a source are dropped."""
+    sid_to_repl = {sid: f"[{num}]" for sid, num in id_to_num.items()}
+    return _CITE_RE.sub(lambda m: sid_to_repl.get(m.group(1), ""), text)
 
 
 class SectionPlan(BaseModel):
@@ -24,6 +94,17 @@ class SectionPlan(BaseModel):
     focus: str = Field(description="What this section should specifically cover - be precise")
     key_points: list[str] = Field(description="3-5 key points to address in this section")
     word_target: int = Field(default=750, description="Target word count per section")
+    model_tier: Literal["fast", "deep"] = Field(
+        default="fast",
+        description="'deep' for sections needing heavy synthesis (subject deep-dives, conclusions, final synthesis), else 'fast'",
+    )
+
+    @model_validator(mode="after")
+    def _route_by_title(self) -> "SectionPlan":
+        """Synthesis-heavy sections always get the flagship model."""
+        if _DEEP_SECTION_RE.search(self.title):
+            self.model_tier = "deep"
+        return self
 
 
 class ReportPlan(BaseModel):
@@ -33,12 +114,28 @@ class ReportPlan(BaseModel):
     total_words: int = Field(default=5500, description="Total target word count")
 
 
+class SectionOutput(BaseModel):
+    """A written section, returned by batched generation."""
+    title: str = Field(description="Exact title of the section from the request")
+    content: str = Field(description="Full markdown for the section, starting with ## <title>")
+
+
+class AllSections(BaseModel):
+    """Several sections written in a single LLM call."""
+    sections: list[SectionOutput] = Field(description="One entry per requested section, in order")
+
+
 class ReportCompiler:
     """Report compiler with intelligent planning to avoid repetition."""
 
     def __init__(self, config: AgentConfig | None = None):
         self.config = config or AgentConfig()
-        self.llm = ChatOpenAI(model=self.config.model, temperature=0.3)
+        # Structure planning and lighter sections use the cheaper model
+        self.llm_fast = get_llm(self.config.fast_model, 0.3)
+        self.llm_deep = get_llm(self.config.model, 0.3)
+        self._plan_llm = get_structured_llm(self.config.fast_model, 0.3, ReportPlan)
+        self.cache = DiskCache("compiler", self.config.cache_dir) if self.config.use_cache else None
+        self.section_cache = get_section_cache(self.config.cache_dir) if self.config.use_cache else None
 
     def compile_report(
         self,
@@ -50,45 +147,166 @@ class ReportCompiler:
         """Generate report with planning step to avoid repetition."""
         print("[Compiler] Generating final report...")
 
-        # Combine all findings
-        all_findings = "\n\n".join(compressed_findings.values())
-
-        # Build source reference
-        source_list = "\n".join([
-            f"- [{s.id}] {s.title}: {s.url}"
-            for s in sources[:50]
-        ])
-
-        # STEP 1: Plan the report structure based on actual findings
-        report_plan = self._plan_report(plan.main_question, all_findings, preferences)
-        print(f"[Compiler] Planned {len(report_plan.sections)} sections")
+        all_findings, source_list, report_plan = self._prepare(
+            plan, sources, compressed_findings, preferences
+        )
+        # Slice once rather than per section
+        findings_for_sections = all_findings[:20000]
+        source_list_for_sections = source_list[:3000]
 
         # STEP 2: Generate each section with specific guidance
         audience = preferences.audience if preferences else "general"
         style = preferences.style if preferences else "general"
 
         section_texts = []
-        previous_content = ""  # Track what's been written to avoid repetition
+        previous_content = ""  # Tail of what's been written, to avoid repetition
 
         for section_plan in report_plan.sections:
 
             section_text = self._generate_section(
                 main_question=plan.main_question,
                 section_plan=section_plan,
-                findings=all_findings[:20000],
-                source_list=source_list[:3000],
+                findings=findings_for_sections,
+                source_list=source_list_for_sections,
                 style=style,
                 audience=audience,
-                previous_content=previous_content[:2000] if previous_content else "",
+                previous_content=previous_content,
             )
             section_texts.append(section_text)
-            previous_content += section_text + "\n\n"
+            # Only a window is shown to the next section, so never keep more than that
+            previous_content = (previous_content + section_text + "\n\n")[-2000:]
 
         report = "\n\n".join(section_texts)
 
         # Format citations
         return self._format_citations(report, sources)
 
+    async def compile_report_async(
+        self,
+        plan: ResearchPlan,
+        sources: list[SourceMetadata],
+        compressed_findings: dict[str, str],
+        preferences: ReportPreferences | None = None,
+    ) -> str:
+        """
+        Generate report with all sections written concurrently.
+
+        Sections can't see each other's text, so instead of the previously
+        written content each one is told what the other sections cover. With
+        `section_batch_size` > 1, consecutive sections share one LLM call so
+        the findings and source list are only sent once per batch.
+        """
+        print("[Compiler] Generating final report...")
+
+        all_findings, source_list, report_plan = await self._aprepare(
+            plan, sources, compressed_findings, preferences
+        )
+        # Slice once rather than per section
+        findings_for_sections = all_findings[:20000]
+        source_list_for_sections = source_list[:3000]
+
+        audience = preferences.audience if preferences else "general"
+        style = preferences.style if preferences else "general"
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SECTIONS)
+
+        batch_size = max(1, self.config.section_batch_size)
+        batches = [
+            report_plan.sections[i:i + batch_size]
+            for i in range(0, len(report_plan.sections), batch_size)
+        ]
+
+        async def generate(batch: list[SectionPlan]) -> list[str]:
+            async with semaphore:
+                if len(batch) == 1:
+                    return [await self._generate_section_async(
+                        main_question=plan.main_question,
+                        section_plan=batch[0],
+                        findings=findings_for_sections,
+                        source_list=source_list_for_sections,
+                        style=style,
+                        audience=audience,
+                        other_sections=self._other_sections(report_plan, batch),
+                    )]
+                return await self._generate_sections_batch_async(
+                    main_question=plan.main_question,
+                    batch=batch,
+                    findings=findings_for_sections,
+                    source_list=source_list_for_sections,
+                    style=style,
+                    audience=audience,
+                    other_sections=self._other_sections(report_plan, batch),
+                )
+
+        batch_texts = await asyncio.gather(*(generate(b) for b in batches))
+        section_texts = [text for texts in batch_texts for text in texts]
+        report = "\n\n".join(section_texts)
+
+        # Format citations
+        return self._format_citations(report, sources)
+
+    def _prepare(
+        self,
+        plan: ResearchPlan,
+        sources: list[SourceMetadata],
+        compressed_findings: dict[str, str],
+        preferences: ReportPreferences | None,
+    ) -> tuple[str, str, ReportPlan]:
+        """Combine findings, build the source reference and plan the report."""
+        all_findings, source_list = self._combine_findings(sources, compressed_findings)
+
+        # STEP 1: Plan the report structure based on actual findings
+        report_plan = self._plan_report(plan.main_question, all_findings, preferences)
+        print(f"[Compiler] Planned {len(report_plan.sections)} sections")
+
+        return all_findings, source_list, report_plan
+
+    async def _aprepare(
+        self,
+        plan: ResearchPlan,
+        sources: list[SourceMetadata],
+        compressed_findings: dict[str, str],
+        preferences: ReportPreferences | None,
+    ) -> tuple[str, str, ReportPlan]:
+        """Async _prepare; the planning call doesn't block the event loop."""
+        all_findings, source_list = self._combine_findings(sources, compressed_findings)
+
+        report_plan = await self._aplan_report(plan.main_question, all_findings, preferences)
+        print(f"[Compiler] Planned {len(report_plan.sections)} sections")
+
+        return all_findings, source_list, report_plan
+
+    @staticmethod
+    def _combine_findings(
+        sources: list[SourceMetadata], compressed_findings: dict[str, str]
+    ) -> tuple[str, str]:
+        """Deduplicated findings and the numbered source reference, both citing [N]."""
+        # Sources are numbered up front so findings, prompts and the model's
+        # output all use the final [N] citations
+        id_to_num = _number_sources(sources)
+
+        # Combine all findings, dropping content repeated across sub-questions
+        all_findings = _renumber_citations("\n\n".join(compressed_findings.values()), id_to_num)
+        deduped = _dedup_findings(all_findings)
+        if len(deduped) < len(all_findings):
+            print(f"[Compiler] Deduplicated findings: {len(all_findings)} -> {len(deduped)} chars")
+        all_findings = deduped
+
+        # Build source reference
+        source_list = "\n".join(
+            f"- [{id_to_num[s.id]}] {s.title} ({s.url})"
+            for s in sources[:50]
+        )
+        return all_findings, source_list
+
+    @staticmethod
+    def _other_sections(report_plan: ReportPlan, batch: list[SectionPlan]) -> str:
+        """Outline of the sections outside this batch, for parallel generation."""
+        return "\n".join(
+            f"- {sp.title}: {sp.focus}"
+            for sp in report_plan.sections
+            if not any(sp is b for b in batch)
+        )
+
     def _plan_report(
         self,
         question: str,
@@ -96,6 +314,26 @@ class ReportCompiler:
         preferences: ReportPreferences | None,
     ) -> ReportPlan:
         """Use LLM to plan report structure based on actual findings and user preferences."""
+        messages = self._plan_messages(question, findings, preferences)
+        return cached_invoke(self.cache, self.llm_fast, messages, ReportPlan, self._plan_llm)
+
+    async def _aplan_report(
+        self,
+        question: str,
+        findings: str,
+        preferences: ReportPreferences | None,
+    ) -> ReportPlan:
+        """Async _plan_report."""
+        messages = self._plan_messages(question, findings, preferences)
+        return await acached_invoke(self.cache, self.llm_fast, messages, ReportPlan, self._plan_llm)
+
+    @staticmethod
+    def _plan_messages(
+        question: str,
+        findings: str,
+        preferences: ReportPreferences | None,
+    ) -> list[BaseMessage]:
+        """Prompt for the report planning call."""
 
         # Extract all preferences
         style = preferences.style if preferences else "general"
@@ -116,69 +354,24 @@ class ReportCompiler:
         if constraints:
             word_guidance = f"Adjust based on: {constraints}. Default: 7-10 sections, 5000-6000 words."
 
-        prompt = f"""Create a COMPREHENSIVE report structure for this research question:
-
-QUESTION: {question}
+        # Static instructions lead so the provider can cache the prompt prefix
+        prompt = f"""QUESTION: {question}
 
 USER PREFERENCES:
 {prefs_section}
 
-RESEARCH FINDINGS (summarized):
-{findings[:12000]}
-
-REPORT STRUCTURE REQUIREMENTS:
-
-1. INTRODUCTION (600-800 words)
-   - Context and significance of the topic
-   - Key themes that will be explored
-   - Current landscape/state of affairs
-
-2. SUBJECT DEEP-DIVES (600-800 words EACH)
-   - If comparing entities: dedicate a full section to EACH major subject
-   - Include specific data, metrics, statistics in each
-   - Use markdown tables for quantitative comparisons
-
-3. ANALYTICAL FRAMEWORK (600-800 words)
-   - Advanced metrics or evaluation criteria
-   - Methodology for assessment
-   - Data-driven analysis with specific numbers
-
-4. CONTEXTUAL FACTORS (500-700 words)
-   - External factors affecting the topic
-   - Recent developments or changes
-   - Constraints, rules, or conditions that matter
-
-5. MULTI-FACETED CONCLUSIONS (600-800 words)
-   - Break down conclusions by CATEGORY (not just one verdict)
-   - "Best in X", "Leading in Y", "Most impactful for Z"
-   - Acknowledge nuance and different perspectives
-
-6. FINAL SYNTHESIS (400-600 words)
-   - Overall verdict with clear reasoning
-   - Forward-looking implications
-   - Key takeaways
-
 LENGTH TARGET: {word_guidance}
 
-CRITICAL RULES:
-- Each section covers DIFFERENT content - NO OVERLAP
-- Section titles should be SPECIFIC to actual content
-- Include markdown tables where data comparisons exist
-- Every claim needs [source_id] citations
-- Be comprehensive - this is a DEEP research report
+RESEARCH FINDINGS (summarized):
+{findings[:12000]}
 
-Create a plan with DISTINCT sections that achieve 5000-6000 words total:"""
+Create a COMPREHENSIVE report structure for this research question, with DISTINCT sections that achieve 5000-6000 words total:"""
 
-        messages = [
-            SystemMessage(content="You are a report structure planner. Create logical, non-repetitive report outlines."),
+        return [
+            SystemMessage(content=COMPILER_PLAN_STATIC_HEADER),
             HumanMessage(content=prompt),
         ]
 
-        structured_llm = self.llm.with_structured_output(ReportPlan)
-        report_plan = structured_llm.invoke(messages)
-
-        return report_plan
-
     def _generate_section(
         self,
         main_question: str,
@@ -190,19 +383,151 @@ Create a plan with DISTINCT sections that achieve 5000-6000 words total:"""
         previous_content: str,
     ) -> str:
         """Generate a comprehensive section with detailed analysis."""
+        key = self._section_key(main_question, section_plan, findings, source_list, style, audience)
+        cached = self._cached_section(key)
+        if cached is not None:
+            return cached
+
+        messages = self._section_messages(
+            main_question, section_plan, findings, source_list, style, audience, previous_content
+        )
+        text = self._llm_for(section_plan).invoke(messages).content
+        self._store_section(key, text)
+        return text
+
+    async def _generate_section_async(
+        self,
+        main_question: str,
+        section_plan: SectionPlan,
+        findings: str,
+        source_list: str,
+        style: str,
+        audience: str,
+        other_sections: str,
+    ) -> str:
+        """Async variant of `_generate_section`."""
+        key = self._section_key(main_question, section_plan, findings, source_list, style, audience)
+        cached = self._cached_section(key)
+        if cached is not None:
+            return cached
+
+        messages = self._section_messages(
+            main_question, section_plan, findings, source_list, style, audience,
+            other_sections=other_sections,
+        )
+        text = (await self._llm_for(section_plan).ainvoke(messages)).content
+        self._store_section(key, text)
+        return text
+
+    async def _generate_sections_batch_async(
+        self,
+        main_question: str,
+        batch: list[SectionPlan],
+        findings: str,
+        source_list: str,
+        style: str,
+        audience: str,
+        other_sections: str,
+    ) -> list[str]:
+        """Write several sections in one structured LLM call, reusing cached ones."""
+        # The whole batch is written by one model, so its sections are cached under
+        # that model rather than each section's own tier
+        llm = self._llm_for(*batch)
+        keys = [
+            self._section_key(main_question, sp, findings, source_list, style, audience, llm.model_name)
+            for sp in batch
+        ]
+        texts = [self._cached_section(key) for key in keys]
+        pending = [i for i, text in enumerate(texts) if text is None]
+
+        if pending:
+            messages = self._batch_messages(
+                main_question, [batch[i] for i in pending], findings, source_list,
+                style, audience, other_sections,
+            )
+            output = await get_structured_llm(llm.model_name, llm.temperature, AllSections).ainvoke(messages)
+            by_title = {s.title.strip(): s.content for s in output.sections}
+            positional = len(output.sections) == len(pending)
+
+            for n, i in enumerate(pending):
+                text = by_title.get(batch[i].title.strip())
+                if text is None and positional:
+                    text = output.sections[n].content
+                if text is None:
+                    # Model dropped a section - write it on its own
+                    text = await self._generate_section_async(
+                        main_question, batch[i], findings, source_list, style, audience, other_sections
+                    )
+                else:
+                    self._store_section(keys[i], text)
+                texts[i] = text
+
+        return texts
+
+    def _section_key(
+        self,
+        main_question: str,
+        section_plan: SectionPlan,
+        findings: str,
+        source_list: str,
+        style: str,
+        audience: str,
+        model: str | None = None,
+    ) -> tuple[str, str]:
+        """(findings digest, plan spec) used to look up a section written by `model` (default: its tier's)."""
+        spec = "\n".join([section_plan.title, section_plan.focus, *section_plan.key_points, style, audience])
+        model = model or self._llm_for(section_plan).model_name
+        return findings_digest(model, main_question, findings, source_list), spec
+
+    def _llm_for(self, *section_plans: SectionPlan) -> "ChatOpenAI":
+        """Flagship model if any of the sections needs it, else the fast model."""
+        if any(sp.model_tier == "deep" for sp in section_plans):
+            return self.llm_deep
+        return self.llm_fast
+
+    def _cached_section(self, key: tuple[str, str]) -> str | None:
+        # Near-identical section plans written from the same findings reuse prior output
+        return self.section_cache.get(*key) if self.section_cache else None
+
+    def _store_section(self, key: tuple[str, str], text: str) -> None:
+        if self.section_cache:
+            self.section_cache.put(*key, text)
+
+    def _section_messages(
+        self,
+        main_question: str,
+        section_plan: SectionPlan,
+        findings: str,
+        source_list: str,
+        style: str,
+        audience: str,
+        previous_content: str = "",
+        other_sections: str = "",
+    ) -> list[BaseMessage]:
+        """
+        Build the prompt for one section.
 
-        audience_guidance = {
-            "student": "Write clearly, explain concepts, educational tone.",
-            "expert": "Assume domain knowledge, focus on nuance and advanced analysis.",
-            "professional": "Business-appropriate, actionable insights.",
-            "general": "Balanced, accessible, engaging.",
-        }.get(audience, "")
+        `previous_content` is text already written (sequential generation);
+        `other_sections` outlines sections written in parallel with this one.
+        """
+        audience_guidance = _AUDIENCE_GUIDANCE.get(audience, "")
 
         key_points_str = "\n".join(f"- {p}" for p in section_plan.key_points)
 
-        prompt = f"""Write a COMPREHENSIVE "{section_plan.title}" section for a deep research report.
+        # Shared content (findings, sources) precedes per-section details so
+        # every section of a report hits the same cached prompt prefix
+        prompt = f"""RESEARCH QUESTION: {main_question}
 
-RESEARCH QUESTION: {main_question}
+RESEARCH FINDINGS:
+{findings}
+
+SOURCES:
+{source_list}
+
+STYLE: {style}
+AUDIENCE: {audience} - {audience_guidance}
+
+Write a COMPREHENSIVE "{section_plan.title}" section for a deep research report.
 
 SECTION: {section_plan.title}
 SPECIFIC FOCUS: {section_plan.focus}
@@ -210,9 +535,39 @@ KEY POINTS TO COVER:
 {key_points_str}
 
 TARGET LENGTH: {section_plan.word_target} words (DO NOT write less)
-AUDIENCE: {audience} - {audience_guidance}
 
-{"ALREADY COVERED (DO NOT REPEAT):" + chr(10) + previous_content[:3000] if previous_content else ""}
+{"ALREADY COVERED (DO NOT REPEAT):" + chr(10) + previous_content if previous_content else ""}
+{"OTHER SECTIONS (covered elsewhere in the report; stay within your focus):" + chr(10) + other_sections if other_sections else ""}
+
+CONTEXT: {get_current_date_context()}
+
+Write the section (start with ## {section_plan.title}):"""
+
+        messages = [
+            SystemMessage(content=COMPILER_SECTION_STATIC_HEADER),
+            HumanMessage(content=prompt),
+        ]
+
+        return messages
+
+    def _batch_messages(
+        self,
+        main_question: str,
+        batch: list[SectionPlan],
+        findings: str,
+        source_list: str,
+        style: str,
+        audience: str,
+        other_sections: str,
+    ) -> list[BaseMessage]:
+        """Build the prompt for several sections written together."""
+        audience_guidance = _AUDIENCE_GUIDANCE.get(audience, "")
+        section_specs = json.dumps(
+            [sp.model_dump(include={"title", "focus", "key_points", "word_target"}) for sp in batch],
+            indent=2,
+        )
+
+        prompt = f"""RESEARCH QUESTION: {main_question}
 
 RESEARCH FINDINGS:
 {findings}
@@ -220,64 +575,73 @@ RESEARCH FINDINGS:
 SOURCES:
 {source_list}
 
-WRITING REQUIREMENTS:
-1. Write COMPREHENSIVE content - aim for {section_plan.word_target} words minimum
-2. Include SPECIFIC data: numbers, percentages, dates, rankings
-3. Use markdown TABLES when comparing 3+ items with metrics:
-   | Item | Metric 1 | Metric 2 | Metric 3 |
-   |------|----------|----------|----------|
-4. Use [source_id] citations for EVERY factual claim
-5. Use ### subheadings to organize content
-6. Include direct quotes from experts/sources when available
-7. Do NOT repeat content from earlier sections
-8. Be analytical - explain WHY data matters, not just WHAT it is
+STYLE: {style}
+AUDIENCE: {audience} - {audience_guidance}
 
-Write the section (start with ## {section_plan.title}):"""
+Write the following {len(batch)} COMPREHENSIVE sections for a deep research report.
 
-        messages = [
-            SystemMessage(content=f"You write detailed {style} research reports. Stay focused on the specific section topic and avoid repeating earlier content.\n{get_current_date_context()}"),
+SECTIONS TO WRITE (each has its own focus, key points and word_target):
+{section_specs}
+
+{"OTHER SECTIONS (covered elsewhere in the report; stay within your focus):" + chr(10) + other_sections if other_sections else ""}
+
+CONTEXT: {get_current_date_context()}
+
+Return every section with its exact title; each content must start with ## <title>."""
+
+        return [
+            SystemMessage(content=COMPILER_SECTION_STATIC_HEADER),
             HumanMessage(content=prompt),
         ]
 
-        response = self.llm.invoke(messages)
-        return response.content
-
     def _format_citations(self, report: str, sources: list[SourceMetadata]) -> str:
-        """Convert [source_id] to [N] and add references."""
+        """Append references for the [N] citations used in the report."""
 
-        used_ids = set(re.findall(r'\[(src_[a-zA-Z0-9]+)\]', report))
-        source_map = {s.id: s for s in sources}
-        id_to_num = {sid: idx for idx, sid in enumerate(sorted(used_ids), 1)}
+        id_to_num = _number_sources(sources)
 
-        # Replace citations
-        def replace(match):
-            sid = match.group(1)
-            return f"[{id_to_num.get(sid, '?')}]"
-
-        report = re.sub(r'\[(src_[a-zA-Z0-9]+)\]', replace, report)
+        # Sections are prompted with numbered sources; only fix up stray ids
+        if "[src_" in report:
+            report = _renumber_citations(report, id_to_num)
 
         # Remove old references section
-        report = re.sub(r'\n+##?\s*References?\s*\n.*', '', report, flags=re.DOTALL | re.IGNORECASE)
+        report = _REFS_RE.sub("", report)
+
+        cited = {
+            int(num)
+            for group in _NUM_CITE_RE.findall(report)
+            for num in group.split(",")
+        }
 
         # Add formatted references
-        if used_ids:
+        if cited:
             refs = ["\n\n## References\n\n"]
-            for sid in sorted(used_ids, key=lambda x: id_to_num.get(x, 999)):
-                num = id_to_num.get(sid)
-                source = source_map.get(sid)
-                if num and source:
+            for source in sources:
+                num = id_to_num[source.id]
+                if num in cited:
                     refs.append(f"[{num}] [{source.title}]({source.url})\n")
             report += "".join(refs)
 
         return report
 
+
+def _source_url(src: SourceMetadata | dict) -> str | None:
+    """URL of a source given either as a model or as a plain dict."""
+    return getattr(src, "url", None) or (src.get("url") if isinstance(src, dict) else None)
+
+
 def compiler_node(state: ResearchState, config: RunnableConfig | None = None) -> dict:
     """LangGraph node for report compilation."""
+    return run_async(acompiler_node(state, config))
 
+
+async def acompiler_node(state: ResearchState, config: RunnableConfig | None = None) -> dict:
+    """Async compiler_node, awaited directly by the graph's async runtime."""
     agent_config = get_config(config or {})
     compiler = ReportCompiler(config=agent_config)
 
-    compressed_findings = state.get("compressed_findings", {})
+    compressed_findings = {
+        q_id: text for q_id, text in state.get("compressed_findings", {}).items() if text
+    }
 
     # Simple fallback if no compressed findings
     if not compressed_findings:
@@ -286,21 +650,19 @@ def compiler_node(state: ResearchState, config: RunnableConfig | None = None) ->
                 compressed_findings[q_id] = f"## {answer.question}\n\n{answer.answer}"
 
     # Gather sources from question_answers (avoid storing separately)
-    all_sources = []
-    seen_urls = set()
-    for q_id, answer in state.get("question_answers", {}).items():
-        if answer and hasattr(answer, "sources"):
-            for src in answer.sources or []:
-                url = src.url if hasattr(src, "url") else src.get("url", "")
-                if url and url not in seen_urls:
-                    seen_urls.add(url)
-                    all_sources.append(src)
+    sources_by_url: dict[str, SourceMetadata] = {}
+    for answer in state.get("question_answers", {}).values():
+        for src in getattr(answer, "sources", None) or []:
+            url = _source_url(src)
+            if url:
+                sources_by_url.setdefault(url, src)
+    all_sources = list(sources_by_url.values())
 
     # Get report preferences from state (parsed from user's request)
     preferences = state.get("report_preferences")
 
-    final_report = compiler.compile_report(
-        plan=state["research_plan"],
+    final_report = await compiler.compile_report_async(
+        plan=as_research_plan(state["research_plan"]),
         sources=all_sources,
         compressed_findings=compressed_findings,
         preferences=preferences,
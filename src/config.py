@@ -4,6 +4,7 @@ Configuration schema for the deep research agent.
 Supports runtime configuration of:
 - Model selection
 - Research parameters
+- Response caching
 """
 
 from pydantic import BaseModel, Field
@@ -14,15 +15,31 @@ class AgentConfig(BaseModel):
 
     # Model
     model: str = Field(default="gpt-4o", description="OpenAI model")
+    fast_model: str = Field(default="gpt-4o-mini", description="Cheaper model for report planning and lighter sections")
+    reflection_model: str | None = Field(default=None, description="Model for the reflection pass (defaults to `model`)")
     temperature: float = Field(default=0.1, description="LLM temperature")
 
     # Search - OPTIMIZED for cost/quality balance
     max_search_results: int = Field(default=5, description="Results per query")
     max_questions: int = Field(default=10, description="Max sub-questions for comprehensive coverage")
+    search_concurrency: int = Field(default=4, description="Concurrent Tavily searches per sub-question")
+    include_planner_example: bool = Field(default=True, description="Show the planner a worked example plan (skipped for expert audiences)")
 
     # Research depth
     max_iterations: int = Field(default=2, description="Max reflection iterations")
+    reflection_token_budget: int = Field(default=15000, description="Tokens of answer text shown to reflection, split across questions by importance (~1500 per question at 10 questions)")
     chars_per_source: int = Field(default=12000, description="Chars per source for compression")
+    synthesis_max_tokens: int = Field(default=2000, description="Max output tokens for a sub-question answer")
+
+    # Report generation
+    section_batch_size: int = Field(default=1, description="Report sections written per LLM call")
+
+    # Caching
+    use_cache: bool = Field(default=True, description="Reuse LLM responses for repeated prompts")
+    cache_dir: str = Field(default="~/.cache/deep_research", description="Directory for on-disk caches")
+    search_cache_ttl: int = Field(default=86400, description="Seconds cached search results stay fresh")
+    extract_cache_ttl: int = Field(default=604800, description="Seconds cached page extracts stay fresh")
+    extract_cache_max_mb: int = Field(default=1024, description="Size cap for cached page extracts; oldest are deleted first")
 
 
 def get_config(config: dict) -> AgentConfig:
@@ -31,9 +48,21 @@ def get_config(config: dict) -> AgentConfig:
 
     return AgentConfig(
         model=configurable.get("model", "gpt-4o"),
+        fast_model=configurable.get("fast_model", "gpt-4o-mini"),
+        reflection_model=configurable.get("reflection_model"),
         temperature=configurable.get("temperature", 0.1),
         max_search_results=configurable.get("max_search_results", 5),
         max_questions=configurable.get("max_questions", 10),
+        search_concurrency=configurable.get("search_concurrency", 4),
+        include_planner_example=configurable.get("include_planner_example", True),
         max_iterations=configurable.get("max_iterations", 2),
+        reflection_token_budget=configurable.get("reflection_token_budget", 15000),
         chars_per_source=configurable.get("chars_per_source", 12000),
+        synthesis_max_tokens=configurable.get("synthesis_max_tokens", 2000),
+        section_batch_size=configurable.get("section_batch_size", 1),
+        use_cache=configurable.get("use_cache", True),
+        cache_dir=configurable.get("cache_dir", "~/.cache/deep_research"),
+        search_cache_ttl=configurable.get("search_cache_ttl", 86400),
+        extract_cache_ttl=configurable.get("extract_cache_ttl", 604800),
+        extract_cache_max_mb=configurable.get("extract_cache_max_mb", 1024),
     )
@@ -2,19 +2,29 @@
 Deep Research Agent Graph.
 
 SIMPLIFIED FLOW:
-1. planner → parallel_researcher (fan out) → aggregate → reflection
+1. planner → parallel_researcher (fan out) → aggregate → reflection (+ compress in parallel)
 2. reflection: if weak answers AND iteration < 2 → fan out to researcher with suggested_searches
 3. reflection: if done → compiler → END
 """
 
+from functools import singledispatch
+
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import END, START, StateGraph
 from langgraph.types import Send
 
-from .compiler import compiler_node
+from .compiler import acompiler_node, compiler_node
 from .planner import planner_node
-from .reflection import reflection_node
-from .researcher import researcher_node
-from .state import ResearchPlan, ResearchState
+from .reflection import areflection_node, reflection_node
+from .researcher import acompress_node, aresearcher_node, compress_node, researcher_node
+from .state import (
+    AgentAnalysis,
+    QuestionAnswer,
+    ResearchPlan,
+    ResearchState,
+    WeakAnswer,
+    as_research_plan,
+)
 
 MAX_ITERATIONS = 2
 
@@ -22,32 +32,60 @@ MAX_ITERATIONS = 2
 # =============================================================================
 # Helpers
 # =============================================================================
+# State values are normally models but may arrive as dicts (e.g. when resumed
+# from a serialized checkpoint). singledispatch resolves the shape by type once
+# per class instead of isinstance-branching on every routing call.
+
+@singledispatch
+def _extract_analysis(analysis: AgentAnalysis) -> tuple[list, list[str]]:
+    """(weak_answers, suggested_searches) from an analysis."""
+    return analysis.weak_answers or [], analysis.suggested_searches or []
+
+
+@_extract_analysis.register(dict)
+def _(analysis: dict) -> tuple[list, list[str]]:
+    return analysis.get("weak_answers", []), analysis.get("suggested_searches", [])
+
+
+@singledispatch
+def _extract_weak(wa: WeakAnswer) -> dict:
+    return {"question_id": wa.question_id, "issue": wa.issue, "suggestion": wa.suggestion}
+
+
+@_extract_weak.register(dict)
+def _(wa: dict) -> dict:
+    return wa
+
+
+@singledispatch
+def _extract_answer(answer: QuestionAnswer) -> tuple[str, list]:
+    return answer.answer, getattr(answer, "sources", [])
+
+
+@_extract_answer.register(dict)
+def _(answer: dict) -> tuple[str, list]:
+    return answer.get("answer", ""), answer.get("sources", [])
+
 
 def _get_plan(state: ResearchState) -> ResearchPlan | None:
-    plan = state.get("research_plan")
-    if not plan:
-        return None
-    return ResearchPlan(**plan) if isinstance(plan, dict) else plan
+    # Usually already a model (no rebuild); dicts from input or checkpoints are validated
+    return as_research_plan(state.get("research_plan"))
 
 
 def _get_weak_answers(state: ResearchState) -> list[dict]:
     analysis = state.get("agent_analysis")
     if not analysis:
         return []
-
-    weak = analysis.get("weak_answers", []) if isinstance(analysis, dict) else (analysis.weak_answers or [])
-
-    return [
-        wa if isinstance(wa, dict) else {"question_id": wa.question_id, "issue": wa.issue, "suggestion": wa.suggestion}
-        for wa in weak
-    ]
+    weak, _ = _extract_analysis(analysis)
+    return [_extract_weak(wa) for wa in weak]
 
 
 def _get_suggested_searches(state: ResearchState) -> list[str]:
     analysis = state.get("agent_analysis")
     if not analysis:
         return []
-    return analysis.get("suggested_searches", []) if isinstance(analysis, dict) else (analysis.suggested_searches or [])
+    _, searches = _extract_analysis(analysis)
+    return searches
 
 
 def _get_answer_data(state: ResearchState, q_id: str) -> tuple[str, list]:
@@ -55,18 +93,18 @@ def _get_answer_data(state: ResearchState, q_id: str) -> tuple[str, list]:
     answer = answers.get(q_id)
     if not answer:
         return "", []
-    return (answer.get("answer", ""), answer.get("sources", [])) if isinstance(answer, dict) else (answer.answer, getattr(answer, "sources", []))
+    return _extract_answer(answer)
 
 
 # =============================================================================
 # Routing
 # =============================================================================
 
-def route_after_planner(state: ResearchState) -> list[Send]:
+def route_after_planner(state: ResearchState) -> str | list[Send]:
     """Fan out to researchers for each sub-question."""
     plan = _get_plan(state)
     if not plan:
-        return [Send("compiler", state)]
+        return "compiler"
 
     main_query = state.get("original_query", "")
     return [
@@ -82,11 +120,14 @@ def aggregate_research(state: ResearchState) -> dict:
     return {}
 
 
-def route_after_reflection(state: ResearchState) -> list[Send]:
+def route_after_reflection(state: ResearchState) -> str | list[Send]:
     """
     After reflection:
     - If weak answers AND iteration < MAX: fan out to researchers with suggested_searches
     - Otherwise: go to compiler
+
+    The compiler is routed to by name so it reads the graph state directly;
+    a Send would copy the whole state (findings included) into its payload.
     """
     iteration = state.get("current_iteration", 0)
     weak_answers = _get_weak_answers(state)
@@ -96,12 +137,12 @@ def route_after_reflection(state: ResearchState) -> list[Send]:
     # If done or max iterations reached → compiler
     if not needs_improvement or iteration >= MAX_ITERATIONS or not weak_answers:
         print(f"[Router] Complete (iteration={iteration}, weak={len(weak_answers)}) -> compiler")
-        return [Send("compiler", state)]
+        return "compiler"
 
     # Need improvement → fan out to researchers with suggested_searches
     plan = _get_plan(state)
     if not plan:
-        return [Send("compiler", state)]
+        return "compiler"
 
     sq_map = {sq.question_id: sq for sq in plan.sub_questions}
 
@@ -124,7 +165,7 @@ def route_after_reflection(state: ResearchState) -> list[Send]:
             "suggested_searches": suggested_searches,  # THE KEY: pass suggested searches
         }))
 
-    return sends if sends else [Send("compiler", state)]
+    return sends if sends else "compiler"
 
 
 # =============================================================================
@@ -134,7 +175,7 @@ def route_after_reflection(state: ResearchState) -> list[Send]:
 def create_research_graph() -> StateGraph:
     """
     Simple flow:
-        planner → [researchers] → aggregate → reflection
+        planner → [researchers] → aggregate → reflection (+ compress)
                                                   ↓
                             [researchers with suggested_searches] (if weak, max 2x)
                                                   ↓
@@ -144,16 +185,19 @@ def create_research_graph() -> StateGraph:
 
     # Nodes
     workflow.add_node("planner", planner_node)
-    workflow.add_node("parallel_researcher", researcher_node)
+    workflow.add_node("parallel_researcher", RunnableLambda(researcher_node, afunc=aresearcher_node, name="parallel_researcher"))
     workflow.add_node("aggregate", aggregate_research)
-    workflow.add_node("reflection", reflection_node)
-    workflow.add_node("compiler", compiler_node)
+    workflow.add_node("compress", RunnableLambda(compress_node, afunc=acompress_node, name="compress"))
+    # Sync and async entry points, so ainvoke/astream await LLM and search calls
+    workflow.add_node("reflection", RunnableLambda(reflection_node, afunc=areflection_node, name="reflection"))
+    workflow.add_node("compiler", RunnableLambda(compiler_node, afunc=acompiler_node, name="compiler"))
 
     # Edges
     workflow.add_edge(START, "planner")
     workflow.add_conditional_edges("planner", route_after_planner, ["parallel_researcher", "compiler"])
     workflow.add_edge("parallel_researcher", "aggregate")
     workflow.add_edge("aggregate", "reflection")
+    workflow.add_edge("aggregate", "compress")  # Runs alongside reflection; compiler reads its output
     workflow.add_conditional_edges("reflection", route_after_reflection, ["parallel_researcher", "compiler"])
     workflow.add_edge("compiler", END)
 
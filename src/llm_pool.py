@@ -0,0 +1,75 @@
+"""
+Shared chat model and search client instances.
+
+Nodes are constructed on every graph invocation; taking models from here means
+clients (and their HTTP connection pools) are built once per process and reused
+across nodes and runs. The Tavily client is kept per event loop, since its
+httpx connections can't move between loops.
+
+Sync nodes that drive async code use `run_async`, which runs coroutines on one
+long-lived background event loop. The shared clients' async connection pools are
+then never used from a loop that has since been closed, as they would be with a
+fresh `asyncio.run` per call.
+"""
+
+import asyncio
+import threading
+import weakref
+from collections.abc import Coroutine
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from langchain_core.runnables import Runnable
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+    from tavily import AsyncTavilyClient
+
+T = TypeVar("T")
+
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_lock = threading.Lock()
+_tavily_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncTavilyClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+@lru_cache(maxsize=8)
+def get_llm(model: str, temperature: float) -> "ChatOpenAI":
+    """Return the process-wide ChatOpenAI for this model and temperature."""
+    # Imported on first use: langchain_openai (and the openai SDK) dominate import time
+    from langchain_openai import ChatOpenAI
+
+    return ChatOpenAI(model=model, temperature=temperature)
+
+
+@lru_cache(maxsize=16)
+def get_structured_llm(model: str, temperature: float, schema: type[BaseModel]) -> Runnable:
+    """Return the shared model bound to `schema` via with_structured_output."""
+    return get_llm(model, temperature).with_structured_output(schema)
+
+
+def get_tavily() -> "AsyncTavilyClient":
+    """Return the shared AsyncTavilyClient for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _tavily_clients.get(loop)
+    if client is None:
+        from tavily import AsyncTavilyClient
+
+        client = _tavily_clients[loop] = AsyncTavilyClient()
+    return client
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="llm-pool-loop", daemon=True).start()
+    return _loop
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion from sync code, on the shared event loop."""
+    return asyncio.run_coroutine_threadsafe(coro, _background_loop()).result()
@@ -8,19 +8,33 @@ This node:
 
 from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_core.runnables import RunnableConfig
-from langchain_openai import ChatOpenAI
 
+from .cache import DiskCache, cached_invoke
 from .config import AgentConfig, get_config
-from .prompts import PLANNER_EXAMPLE, PLANNER_SYSTEM_PROMPT, get_current_date_context
+from .llm_pool import get_llm, get_structured_llm
+from .prompts import (
+    PLANNER_EXAMPLE,
+    PLANNER_PARSE_REQUEST_PROMPT,
+    PLANNER_SYSTEM_PROMPT,
+    get_current_date_context,
+)
 from .state import ReportPreferences, ResearchPlan, ResearchState
 
+_AUDIENCE_CONTEXT: dict[str, str] = {
+    "student": " (explain concepts clearly, educational tone)",
+    "expert": " (assume domain knowledge, focus on nuance)",
+}
+
 
 class Planner:
     """Planner parses requests and creates research plans."""
 
     def __init__(self, config: AgentConfig | None = None):
         self.config = config or AgentConfig()
-        self.llm = ChatOpenAI(model=self.config.model, temperature=0)
+        self.llm = get_llm(self.config.model, 0)
+        self._prefs_llm = get_structured_llm(self.config.model, 0, ReportPreferences)
+        self._plan_llm = get_structured_llm(self.config.model, 0, ResearchPlan)
+        self.cache = DiskCache("planner", self.config.cache_dir) if self.config.use_cache else None
 
     def parse_request(self, user_input: str) -> ReportPreferences:
         """
@@ -34,32 +48,12 @@ class Planner:
         Returns:
             ReportPreferences with extracted info
         """
-        prompt = f"""Parse this user request and extract the research details.
-
-USER REQUEST:
-{user_input}
-
-Extract:
-1. research_question: The core question to research (clean, focused)
-2. style: Report style - one of: academic, technical, executive, comparative, general
-   - "technical" = detailed stats, metrics, analysis
-   - "academic" = scholarly, citations, methodology
-   - "comparative" = comparing entities side by side
-   - "executive" = brief, key points, recommendations
-   - "general" = balanced, readable
-3. focus_areas: Specific topics to emphasize (as a list)
-4. audience: Who is this for? student, professional, general, expert
-5. constraints: Any mentioned constraints (deadline, length, format)
-
-If something isn't specified, use sensible defaults based on context."""
-
         messages = [
-            SystemMessage(content="You extract structured information from natural language requests."),
-            HumanMessage(content=prompt),
+            SystemMessage(content=PLANNER_PARSE_REQUEST_PROMPT),
+            HumanMessage(content=f"USER REQUEST:\n{user_input}"),
         ]
 
-        structured_llm = self.llm.with_structured_output(ReportPreferences)
-        preferences = structured_llm.invoke(messages)
+        preferences = cached_invoke(self.cache, self.llm, messages, ReportPreferences, self._prefs_llm)
         print(f"[Planner] Parsed request: {preferences.research_question[:60]}...")
         return preferences
 
@@ -80,23 +74,25 @@ If something isn't specified, use sensible defaults based on context."""
                            "\n".join(f"- {area}" for area in preferences.focus_areas)
 
         audience_context = f"\nTARGET AUDIENCE: {preferences.audience}"
-        if preferences.audience == "student":
-            audience_context += " (explain concepts clearly, educational tone)"
-        elif preferences.audience == "expert":
-            audience_context += " (assume domain knowledge, focus on nuance)"
+        audience_context += _AUDIENCE_CONTEXT.get(preferences.audience, "")
+
+        # One static system message keeps the prompt prefix identical across runs;
+        # experts rarely need the worked example, so it's dropped for them
+        system_prompt = PLANNER_SYSTEM_PROMPT
+        if self.config.include_planner_example and preferences.audience != "expert":
+            system_prompt += f"\n\nExample structure:\n\n{PLANNER_EXAMPLE}"
 
         messages = [
-            SystemMessage(content=PLANNER_SYSTEM_PROMPT.format(date_context=get_current_date_context())),
-            SystemMessage(content=f"Example structure:\n\n{PLANNER_EXAMPLE}"),
+            SystemMessage(content=system_prompt),
             HumanMessage(
                 content=f"Create a research plan for: {preferences.research_question}"
                 f"{focus_context}"
                 f"{audience_context}"
+                f"\n\nCONTEXT: {get_current_date_context()}"
             ),
         ]
 
-        structured_llm = self.llm.with_structured_output(ResearchPlan)
-        plan = structured_llm.invoke(messages)
+        plan = cached_invoke(self.cache, self.llm, messages, ResearchPlan, self._plan_llm)
 
         # Limit questions to save API calls (focus on quality over quantity)
         if len(plan.sub_questions) > self.config.max_questions:
@@ -3,6 +3,7 @@ System prompts for the deep research agent.
 """
 
 from datetime import datetime
+from functools import lru_cache
 
 
 def get_current_date_context() -> str:
@@ -16,10 +17,8 @@ def get_current_date_context() -> str:
 
 PLANNER_SYSTEM_PROMPT = """You are a research planning expert. Your job is to decompose complex research queries into structured, answerable sub-questions using a systematic methodology.
 
-CONTEXT: {date_context}
-
 TEMPORAL FOCUS:
-- DEFAULT: Prioritize CURRENT information based on today's date above
+- DEFAULT: Prioritize CURRENT information based on today's date (given with the request)
   * Recent news and developments (last 6 months)
   * Current statistics and rankings (current season/year)
   * Latest expert opinions and analyses
@@ -71,6 +70,7 @@ GUIDELINES:
   * Include search terms for CURRENT information (dates, "latest", "current")
   * Specify what DATA TYPE to seek (quantitative stats OR qualitative analysis)
 - Mark importance: "critical", "important", or "supporting"
+- For each sub-question, write 3-4 concrete web search queries (search_queries) that would find its answer
 - Balance quantitative (numbers, stats, effect sizes) and qualitative (opinions, analysis) questions
 
 OUTPUT: A flat list of sub-questions with taxonomy category labels."""
@@ -186,6 +186,27 @@ QUALITY CHECKLIST:
 
 DO NOT truncate or cut off your response. Complete the full answer."""
 
+# Sent in the synthesis system message (not per request) so it stays in the cached prefix
+SYNTHESIS_CITATION_RULE = """Write a COMPLETE, COMPREHENSIVE answer (500-1000 words) using ALL relevant findings given. Do not stop early.
+**CRITICAL: Include [source_id] citations for EVERY factual claim.** Example: 'Player X averaged 30 points [src_abc123].' This is required."""
+
+
+@lru_cache(maxsize=4)
+def get_researcher_system_prompt(date_context: str) -> str:
+    """RESEARCHER_SYSTEM_PROMPT formatted for a date; the date changes daily, so this rarely misses."""
+    return RESEARCHER_SYSTEM_PROMPT.format(date_context=date_context)
+
+
+# Kept free of per-question text so the whole prompt is a cacheable prefix;
+# the question goes in the human message
+FINDING_EXTRACTION_PROMPT = """You are a research analyst extracting key findings from sources.
+
+Extract 3-6 SPECIFIC, FACTUAL findings from the sources that answer the given question. Each finding should:
+1. Be a concrete claim with specific data (numbers, names, dates, statistics)
+2. Include supporting evidence (quote or paraphrase from source)
+3. Reference the source ID it came from (e.g. src_xxx)
+4. Rate confidence as high, medium or low"""
+
 # ============================================================================
 # Compression Prompts (per-researcher compression like Open Deep Research)
 # ============================================================================
@@ -375,3 +396,78 @@ CITATION REQUIREMENTS:
 - Distinguish between facts and analysis/interpretation
 
 OUTPUT: A comprehensive, publication-quality research report with rich data tables."""
+
+# Static prefixes: dynamic values (question, findings, section plan, date) are
+# appended after these so repeated calls share a cacheable prompt prefix.
+
+COMPILER_PLAN_STATIC_HEADER = """You are a report structure planner. Create logical, non-repetitive report outlines.
+
+REPORT STRUCTURE REQUIREMENTS:
+
+1. INTRODUCTION (600-800 words)
+   - Context and significance of the topic
+   - Key themes that will be explored
+   - Current landscape/state of affairs
+
+2. SUBJECT DEEP-DIVES (600-800 words EACH)
+   - If comparing entities: dedicate a full section to EACH major subject
+   - Include specific data, metrics, statistics in each
+   - Use markdown tables for quantitative comparisons
+
+3. ANALYTICAL FRAMEWORK (600-800 words)
+   - Advanced metrics or evaluation criteria
+   - Methodology for assessment
+   - Data-driven analysis with specific numbers
+
+4. CONTEXTUAL FACTORS (500-700 words)
+   - External factors affecting the topic
+   - Recent developments or changes
+   - Constraints, rules, or conditions that matter
+
+5. MULTI-FACETED CONCLUSIONS (600-800 words)
+   - Break down conclusions by CATEGORY (not just one verdict)
+   - "Best in X", "Leading in Y", "Most impactful for Z"
+   - Acknowledge nuance and different perspectives
+
+6. FINAL SYNTHESIS (400-600 words)
+   - Overall verdict with clear reasoning
+   - Forward-looking implications
+   - Key takeaways
+
+CRITICAL RULES:
+- Each section covers DIFFERENT content - NO OVERLAP
+- Section titles should be SPECIFIC to actual content
+- Include markdown tables where data comparisons exist
+- Every claim needs [N] citations
+- Be comprehensive - this is a DEEP research report
+- Follow the USER PREFERENCES and LENGTH TARGET given with the request"""
+
+COMPILER_SECTION_STATIC_HEADER = """You write detailed research reports in the requested STYLE. Stay focused on the specific section topic and avoid repeating earlier content.
+
+WRITING REQUIREMENTS:
+1. Write COMPREHENSIVE content - aim for the TARGET LENGTH as a minimum
+2. Include SPECIFIC data: numbers, percentages, dates, rankings
+3. Use markdown TABLES when comparing 3+ items with metrics:
+   | Item | Metric 1 | Metric 2 | Metric 3 |
+   |------|----------|----------|----------|
+4. Cite as [1], [2] using the numbered SOURCES list for EVERY factual claim
+5. Use ### subheadings to organize content
+6. Include direct quotes from experts/sources when available
+7. Do NOT repeat content from earlier sections
+8. Be analytical - explain WHY data matters, not just WHAT it is"""
+
+PLANNER_PARSE_REQUEST_PROMPT = """You extract structured information from natural language requests.
+
+Parse the user request and extract the research details:
+1. research_question: The core question to research (clean, focused)
+2. style: Report style - one of: academic, technical, executive, comparative, general
+   - "technical" = detailed stats, metrics, analysis
+   - "academic" = scholarly, citations, methodology
+   - "comparative" = comparing entities side by side
+   - "executive" = brief, key points, recommendations
+   - "general" = balanced, readable
+3. focus_areas: Specific topics to emphasize (as a list)
+4. audience: Who is this for? student, professional, general, expert
+5. constraints: Any mentioned constraints (deadline, length, format)
+
+If something isn't specified, use sensible defaults based on context."""
@@ -7,13 +7,65 @@ Evaluates completed research against quality criteria and identifies:
 - Conflicting information across sources
 """
 
-from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+import hashlib
+import io
+from collections import OrderedDict
+from functools import lru_cache
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
 from langchain_core.runnables import RunnableConfig
-from langchain_openai import ChatOpenAI
 
 from .config import AgentConfig, get_config
+from .llm_pool import get_llm, get_structured_llm
 from .prompts import REFLECTION_SYSTEM_PROMPT
-from .state import AgentAnalysis, QuestionAnswer, ResearchPlan, ResearchState
+from .state import AgentAnalysis, QuestionAnswer, ResearchPlan, ResearchState, as_research_plan
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+CHARS_PER_TOKEN = 4  # Estimate used when no tokenizer is available
+
+# Share of the answer token budget per sub-question, by importance
+_IMPORTANCE_WEIGHT: dict[str, int] = {"critical": 3, "important": 2, "supporting": 1}
+
+_SYSTEM_MESSAGE = SystemMessage(content=REFLECTION_SYSTEM_PROMPT)
+
+# Analyses of recently seen (model, research summary) pairs, so replays and
+# retries of the same research state skip the LLM call
+_ANALYSIS_CACHE: OrderedDict[str, AgentAnalysis] = OrderedDict()
+_ANALYSIS_CACHE_SIZE = 128
+
+
+@lru_cache(maxsize=4)
+def _get_encoding(model: str):
+    """Tokenizer for `model`, or None if tiktoken or its encoding data is unavailable."""
+    if tiktoken is None:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            # Unknown to tiktoken (custom or Azure deployment names)
+            return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        # Encodings are downloaded on first use; offline we fall back to estimates
+        print(f"[Reflection] Tokenizer unavailable, estimating tokens: {e}")
+        return None
+
+
+def _truncate_tokens(text: str, max_tokens: int, model: str) -> tuple[str, bool]:
+    """Cut `text` to at most `max_tokens` tokens. Returns (text, was_truncated)."""
+    encoding = _get_encoding(model)
+    if encoding is None:
+        limit = max_tokens * CHARS_PER_TOKEN
+        return text[:limit], len(text) > limit
+
+    tokens = encoding.encode(text)
+    if len(tokens) <= max_tokens:
+        return text, False
+    return encoding.decode(tokens[:max_tokens]), True
 
 
 class ReflectionAnalyzer:
@@ -32,7 +84,10 @@ class ReflectionAnalyzer:
             config: AgentConfig with model settings
         """
         self.config = config or AgentConfig()
-        self.llm = ChatOpenAI(model=self.config.model, temperature=0)
+        # Reflection is a classification-style pass, so it can run on a smaller model
+        self.model = self.config.reflection_model or self.config.model
+        self.llm = get_llm(self.model, 0)
+        self.structured_llm = get_structured_llm(self.model, 0, AgentAnalysis)
 
     def analyze_research(
         self, plan: ResearchPlan, answers: dict[str, QuestionAnswer]
@@ -47,21 +102,26 @@ class ReflectionAnalyzer:
         Returns:
             AgentAnalysis with assessment and suggestions
         """
-        # Format current research for analysis
-        research_summary = self._format_research_summary(plan, answers)
+        key, messages = self._analysis_request(plan, answers)
+        cached = self._cached_analysis(key)
+        if cached is not None:
+            return cached
 
-        # Get structured analysis
-        messages = [
-            SystemMessage(content=REFLECTION_SYSTEM_PROMPT),
-            HumanMessage(
-                content=f"Research Plan and Current Findings:\n\n{research_summary}\n\n"
-                f"Provide a critical analysis of this research with specific suggestions."
-            ),
-        ]
-
-        structured_llm = self.llm.with_structured_output(AgentAnalysis)
-        analysis = structured_llm.invoke(messages)
+        analysis = self.structured_llm.invoke(messages)
+        self._store_analysis(key, analysis)
+        return analysis
 
+    async def analyze_research_async(
+        self, plan: ResearchPlan, answers: dict[str, QuestionAnswer]
+    ) -> AgentAnalysis:
+        """Async variant of analyze_research, for the graph's async runtime."""
+        key, messages = self._analysis_request(plan, answers)
+        cached = self._cached_analysis(key)
+        if cached is not None:
+            return cached
+
+        analysis = await self.structured_llm.ainvoke(messages)
+        self._store_analysis(key, analysis)
         return analysis
 
     def format_analysis_message(self, analysis: AgentAnalysis) -> str:
@@ -127,18 +187,61 @@ class ReflectionAnalyzer:
 
     # Helper methods
 
+    def _analysis_request(
+        self, plan: ResearchPlan, answers: dict[str, QuestionAnswer]
+    ) -> tuple[str, list[BaseMessage]]:
+        """Build the analysis prompt and its memo key."""
+        # Format current research for analysis
+        research_summary = self._format_research_summary(plan, answers)
+
+        key = hashlib.blake2b(
+            f"{self.model}\x00{research_summary}".encode(), digest_size=16
+        ).hexdigest()
+
+        messages = [
+            _SYSTEM_MESSAGE,
+            HumanMessage(
+                content=f"Research Plan and Current Findings:\n\n{research_summary}\n\n"
+                f"Provide a critical analysis of this research with specific suggestions."
+            ),
+        ]
+        return key, messages
+
+    @staticmethod
+    def _cached_analysis(key: str) -> AgentAnalysis | None:
+        cached = _ANALYSIS_CACHE.get(key)
+        if cached is not None:
+            _ANALYSIS_CACHE.move_to_end(key)
+            print("[Reflection] Reusing analysis of identical research state")
+        return cached
+
+    @staticmethod
+    def _store_analysis(key: str, analysis: AgentAnalysis) -> None:
+        _ANALYSIS_CACHE[key] = analysis
+        if len(_ANALYSIS_CACHE) > _ANALYSIS_CACHE_SIZE:
+            _ANALYSIS_CACHE.popitem(last=False)
+
     def _format_research_summary(
         self, plan: ResearchPlan, answers: dict[str, QuestionAnswer]
     ) -> str:
         """Format research for LLM analysis."""
-        summary_parts = [f"# Research on: {plan.main_question}\n"]
-        summary_parts.append("\n## Research Questions and Answers\n")
+        # Split the answer token budget across questions, weighted by importance
+        weights = [_IMPORTANCE_WEIGHT.get(sq.importance, 1) for sq in plan.sub_questions]
+        budget_per_weight = self.config.reflection_token_budget / (sum(weights) or 1)
+
+        buf = io.StringIO()
+        buf.write(f"# Research on: {plan.main_question}\n")
+        buf.write("\n## Research Questions and Answers\n")
+        buf.write(
+            "Long answers are shown as excerpts. Judge completeness from the reported "
+            "completeness and source counts, not from where an excerpt stops.\n"
+        )
 
         # Flat structure
-        for sq in plan.sub_questions:
+        for sq, weight in zip(plan.sub_questions, weights):
             answer = answers.get(sq.question_id)
-            summary_parts.append(f"\n### Question {sq.question_id}: {sq.question}\n")
-            summary_parts.append(f"**Importance**: {sq.importance}\n")
+            buf.write(f"\n### Question {sq.question_id}: {sq.question}\n")
+            buf.write(f"**Importance**: {sq.importance}\n")
 
             if answer:
                 # Handle both dict and QuestionAnswer objects (state serialization)
@@ -153,20 +256,32 @@ class ReflectionAnalyzer:
                     completeness = answer.completeness
                     sources = answer.sources
 
-                # Show full answer up to 6000 chars (covers most answers completely)
+                # Show the answer up to this question's share of the token budget
                 # No middle markers that confuse the LLM
-                answer_preview = answer_text[:6000]
-                truncated = "..." if len(answer_text) > 6000 else ""
-                summary_parts.append(f"**Answer** ({len(answer_text)} chars, completeness={completeness}):\n{answer_preview}{truncated}\n\n")
-                summary_parts.append(
+                preview, truncated = _truncate_tokens(
+                    answer_text, int(budget_per_weight * weight), self.model
+                )
+                if truncated:
+                    # Tell the reviewer the cut is ours, so it doesn't read as an incomplete answer
+                    buf.write(
+                        f"**Answer** (EXCERPT - truncated for review; full answer is "
+                        f"{len(answer_text)} chars, completeness={completeness}):\n"
+                    )
+                    buf.write(preview)
+                    buf.write(" [...excerpt ends]\n\n")
+                else:
+                    buf.write(f"**Answer** ({len(answer_text)} chars, completeness={completeness}):\n")
+                    buf.write(preview)
+                    buf.write("\n\n")
+                buf.write(
                     f"**Confidence**: {confidence}, "
                     f"**Completeness**: {completeness}, "
                     f"**Sources**: {len(sources)}\n"
                 )
             else:
-                summary_parts.append("**Status**: Not yet researched\n")
+                buf.write("**Status**: Not yet researched\n")
 
-        return "".join(summary_parts)
+        return buf.getvalue()
 
 
 # ============================================================================
@@ -184,14 +299,30 @@ def reflection_node(state: ResearchState, config: RunnableConfig | None = None)
     agent_config = get_config(config or {})
     analyzer = ReflectionAnalyzer(config=agent_config)
 
-    plan = state["research_plan"]
-    answers = state["question_answers"]
-    current_iteration = state.get("current_iteration", 0)
+    analysis = analyzer.analyze_research(as_research_plan(state["research_plan"]), state["question_answers"])
+    return _reflection_update(state, analyzer, analysis, agent_config)
 
-    if isinstance(plan, dict):
-        plan = ResearchPlan(**plan)
 
-    analysis = analyzer.analyze_research(plan, answers)
+async def areflection_node(state: ResearchState, config: RunnableConfig | None = None) -> dict:
+    """Async reflection_node; awaits the analysis instead of blocking the event loop."""
+    print("[Reflection] Analyzing research quality...")
+    agent_config = get_config(config or {})
+    analyzer = ReflectionAnalyzer(config=agent_config)
+
+    analysis = await analyzer.analyze_research_async(
+        as_research_plan(state["research_plan"]), state["question_answers"]
+    )
+    return _reflection_update(state, analyzer, analysis, agent_config)
+
+
+def _reflection_update(
+    state: ResearchState,
+    analyzer: ReflectionAnalyzer,
+    analysis: AgentAnalysis,
+    agent_config: AgentConfig,
+) -> dict:
+    """State update for an analysis: route to re-research or compile."""
+    current_iteration = state.get("current_iteration", 0)
     analysis_message = analyzer.format_analysis_message(analysis)
 
     # Decide: improve or compile report
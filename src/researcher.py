@@ -5,22 +5,94 @@ This node handles searching, extracting findings, and synthesizing answers
 for individual sub-questions.
 """
 
-import uuid
+import asyncio
+import hashlib
+import heapq
+import io
+import json
 from datetime import datetime
 
-from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_core.runnables import RunnableConfig
-from langchain_openai import ChatOpenAI
-from tavily import TavilyClient
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
+from langchain_core.runnables import Runnable, RunnableConfig
 
+from .cache import DiskCache, acached_invoke, query_key
 from .config import AgentConfig, get_config
+from .llm_pool import get_llm, get_structured_llm, get_tavily, run_async
 from .prompts import (
     ANSWER_SYNTHESIS_PROMPT,
     COMPRESS_RESEARCH_PROMPT,
-    RESEARCHER_SYSTEM_PROMPT,
+    FINDING_EXTRACTION_PROMPT,
+    SYNTHESIS_CITATION_RULE,
     get_current_date_context,
+    get_researcher_system_prompt,
 )
-from .state import Finding, QuestionAnswer, ResearchState, SourceMetadata, SubQuestion
+from .state import (
+    Finding,
+    FindingsList,
+    QuestionAnswer,
+    ResearchState,
+    SourceMetadata,
+    SubQuestion,
+    as_research_plan,
+)
+
+_SYNTHESIS_SYSTEM_MESSAGE = SystemMessage(content=f"{ANSWER_SYNTHESIS_PROMPT}\n\n{SYNTHESIS_CITATION_RULE}")
+EXTRACTION_CHARS_PER_CALL = 16000  # Source preview chars per finding-extraction call (~4 sources)
+
+# Bump to invalidate cached page extracts (e.g. if the extract parameters change)
+_EXTRACT_CACHE_VERSION = "1"
+
+_CONTINUE_MESSAGE = HumanMessage(
+    content="Continue the answer exactly where it stopped. Do not repeat any earlier text."
+)
+
+
+def _group_by_chars(
+    previews: list[tuple[SourceMetadata, str]], max_chars: int
+) -> list[list[tuple[SourceMetadata, str]]]:
+    """Split previews, in order, into groups of at most `max_chars` (one oversize preview per group)."""
+    groups: list[list[tuple[SourceMetadata, str]]] = []
+    size = max_chars
+    for item in previews:
+        if size + len(item[1]) > max_chars:
+            groups.append([])
+            size = 0
+        groups[-1].append(item)
+        size += len(item[1])
+    return groups
+
+
+def _fallback_findings(previews: list[tuple[SourceMetadata, str]]) -> list[Finding]:
+    """Basic low-confidence findings straight from the sources, when extraction fails."""
+    return [
+        Finding.model_construct(
+            claim=source.title,
+            evidence=preview[:500],
+            source_ids=[source.id],
+            confidence="low",
+        )
+        for source, preview in previews[:5]
+    ]
+
+
+def _finding_sort_key(finding: Finding) -> tuple[str, str]:
+    """Order findings by first cited source, then claim."""
+    return (finding.source_ids[0] if finding.source_ids else "", finding.claim)
+
+
+def _extract_key(url: str) -> str:
+    """Cache key for an extracted page."""
+    return hashlib.sha256(f"{_EXTRACT_CACHE_VERSION}|{url}".encode()).hexdigest()
+
+
+async def _astream_text(llm: Runnable, messages: list[BaseMessage]) -> tuple[str, str | None]:
+    """Stream a completion into a buffer. Returns (text, finish_reason)."""
+    buf = io.StringIO()
+    finish_reason = None
+    async for chunk in llm.astream(messages):
+        buf.write(chunk.content)
+        finish_reason = chunk.response_metadata.get("finish_reason") or finish_reason
+    return buf.getvalue(), finish_reason
 
 
 class Researcher:
@@ -32,6 +104,9 @@ class Researcher:
     2. Execute searches via Tavily API
     3. Extract structured findings from results
     4. Synthesize comprehensive answer with citations
+
+    The LLM steps are async (`a*` methods) so a node's searches and calls don't
+    block the event loop; the sync methods run them via `run_async`.
     """
 
     def __init__(self, config: AgentConfig | None = None):
@@ -43,16 +118,26 @@ class Researcher:
                    If None, uses defaults.
         """
         self.config = config or AgentConfig()
-        self.llm = ChatOpenAI(
-            model=self.config.model,
-            temperature=self.config.temperature
+        self.llm = get_llm(self.config.model, self.config.temperature)
+        self.extractor_llm = get_structured_llm(self.config.model, self.config.temperature, FindingsList)
+        # Room for a full 500-1000 word answer up front, so truncation retries are rare
+        self.synthesis_llm = self.llm.bind(max_tokens=self.config.synthesis_max_tokens)
+
+        self.cache = DiskCache("researcher", self.config.cache_dir) if self.config.use_cache else None
+        self.search_cache = DiskCache("search", self.config.cache_dir) if self.config.use_cache else None
+        self.extract_cache = (
+            DiskCache("extract", self.config.cache_dir, max_bytes=self.config.extract_cache_max_mb * 1_000_000)
+            if self.config.use_cache else None
         )
 
-        # Initialize search client
-        self.search_client = TavilyClient()
-
     def generate_search_queries(
         self, sub_question: SubQuestion, main_query: str
+    ) -> list[str]:
+        """Sync wrapper for agenerate_search_queries."""
+        return run_async(self.agenerate_search_queries(sub_question, main_query))
+
+    async def agenerate_search_queries(
+        self, sub_question: SubQuestion, main_query: str
     ) -> list[str]:
         """
         Generate 3-4 targeted search queries for a sub-question.
@@ -72,12 +157,16 @@ Main Topic Context: {main_query}
 
 Return ONLY the search queries, one per line, no numbering or formatting."""
 
-        response = self.llm.invoke([HumanMessage(content=prompt)])
+        response = await self.llm.ainvoke([HumanMessage(content=prompt)])
         queries = [q.strip() for q in response.content.strip().split("\n") if q.strip()]
 
         return queries[:4]  # Limit to 4 queries
 
     def search_tavily(self, query: str, max_results: int | None = None) -> list[dict]:
+        """Sync wrapper for asearch_tavily."""
+        return run_async(self.asearch_tavily(query, max_results))
+
+    async def asearch_tavily(self, query: str, max_results: int | None = None) -> list[dict]:
         """
         Execute Tavily web search (search only, no extract - cheaper).
 
@@ -91,19 +180,34 @@ Return ONLY the search queries, one per line, no numbering or formatting."""
         if max_results is None:
             max_results = self.config.max_search_results
 
+        # Suggested searches often repeat earlier queries, so serve recent results
+        key = query_key(query, max_results)
+        if self.search_cache is not None:
+            hit = self.search_cache.get(key, max_age=self.config.search_cache_ttl)
+            if hit is not None:
+                return json.loads(hit)
+
         try:
-            response = self.search_client.search(
+            response = await get_tavily().search(
                 query=query,
                 max_results=max_results,
                 search_depth="basic",
                 include_answer=True,
             )
-            return response.get("results", [])
         except (ConnectionError, TimeoutError, ValueError) as e:
             print(f"Tavily search error: {e}")
             return []
 
+        results = response.get("results", [])
+        if self.search_cache is not None and results:
+            self.search_cache.set(key, json.dumps(results))
+        return results
+
     def extract_full_content(self, urls: list[str]) -> dict[str, str]:
+        """Sync wrapper for aextract_full_content."""
+        return run_async(self.aextract_full_content(urls))
+
+    async def aextract_full_content(self, urls: list[str]) -> dict[str, str]:
         """
         Extract full page content from URLs using Tavily Extract API.
 
@@ -117,20 +221,40 @@ Return ONLY the search queries, one per line, no numbering or formatting."""
         """
         if not urls:
             return {}
+        urls = urls[:10]
+
+        # Pages recur across sub-questions and improvement passes; only fetch the misses
+        contents = {}
+        if self.extract_cache is not None:
+            for url in urls:
+                hit = self.extract_cache.get(_extract_key(url), max_age=self.config.extract_cache_ttl)
+                if hit is not None:
+                    contents[url] = json.loads(hit)
+        urls_to_fetch = [u for u in urls if u not in contents]
+        if not urls_to_fetch:
+            return contents
 
         try:
-            response = self.search_client.extract(urls=urls[:10])
-            return {
-                r.get("url"): r.get("raw_content", "")
-                for r in response.get("results", [])
-                if r.get("url") and r.get("raw_content")
-            }
+            response = await get_tavily().extract(urls=urls_to_fetch)
         except (ConnectionError, TimeoutError, ValueError) as e:
             print(f"Tavily extract error: {e}")
-            return {}
+            return contents
+
+        for r in response.get("results", []):
+            if r.get("url") and r.get("raw_content"):
+                contents[r["url"]] = r["raw_content"]
+                if self.extract_cache is not None:
+                    self.extract_cache.set(_extract_key(r["url"]), json.dumps(r["raw_content"]))
+        return contents
 
     def extract_findings(
         self, search_results: list[dict], sub_question: SubQuestion
+    ) -> tuple[list[Finding], list[SourceMetadata]]:
+        """Sync wrapper for aextract_findings."""
+        return run_async(self.aextract_findings(search_results, sub_question))
+
+    async def aextract_findings(
+        self, search_results: list[dict], sub_question: SubQuestion
     ) -> tuple[list[Finding], list[SourceMetadata]]:
         """
         Extract structured findings from search results.
@@ -145,110 +269,82 @@ Return ONLY the search queries, one per line, no numbering or formatting."""
         if not search_results:
             return [], []
 
-        all_findings = []
         all_sources = []
 
-        # Create sources and collect content for extraction
-        source_contents = []
+        # Create sources and slice each one's prompt preview once (limit each to prevent overflow)
+        previews: list[tuple[SourceMetadata, str]] = []
+        timestamp = datetime.now().isoformat()
         for result in search_results:
-            content = result.get("full_content") or result.get("content", "")
-            source = SourceMetadata(
-                id=f"src_{uuid.uuid4().hex[:8]}",
-                url=result.get("url", ""),
-                title=result.get("title", ""),
+            content = result.get("full_content") or result.get("content") or ""
+            url = result.get("url") or ""
+            # Every field is already a str, so skip validation (this runs once per source)
+            source = SourceMetadata.model_construct(
+                # Derived from the URL so a page keeps one id across sub-questions
+                id=f"src_{hashlib.sha1(url.encode()).hexdigest()[:8]}",
+                url=url,
+                title=result.get("title") or "",
                 full_content=content,
-                timestamp=datetime.now().isoformat(),
+                timestamp=timestamp,
             )
             all_sources.append(source)
-            # Keep content for finding extraction (limit each to prevent overflow)
-            source_contents.append({
-                "id": source.id,
-                "title": source.title,
-                "content": content[:4000] if content else ""
-            })
-
-        # Extract findings from ALL sources in one call (more context = better extraction)
-        formatted_sources = "\n\n".join([
-            f"[{s['id']}] {s['title']}\n{s['content']}"
-            for s in source_contents if s['content']
-        ])
-
-        messages = [
-            SystemMessage(content=f"""You are a research analyst extracting key findings from sources.
-
-For the question: {sub_question.question}
+            if content:
+                previews.append((source, content[:4000]))
+
+        # Extract from a few sources per call, in parallel: each prompt stays well under the
+        # context limit, and a failed call (bad output or API error) only costs its own sources
+        groups = _group_by_chars(previews, EXTRACTION_CHARS_PER_CALL)
+        results = await asyncio.gather(
+            *(self._aextract_group(group, sub_question) for group in groups), return_exceptions=True
+        )
+        all_findings = []
+        for group, result in zip(groups, results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result  # Cancellation etc.
+                print(f"Error extracting findings: {result}")
+                result = _fallback_findings(group)
+            all_findings.extend(result)
 
-Extract 3-6 SPECIFIC, FACTUAL findings from the sources below. Each finding should:
-1. Be a concrete claim with specific data (numbers, names, dates, statistics)
-2. Include supporting evidence (quote or paraphrase from source)
-3. Reference the source ID [src_xxx]
+        return all_findings, all_sources
 
-Format each finding as:
-CLAIM: [specific factual claim]
-EVIDENCE: [supporting quote or data from source]
-SOURCE: [source_id]
-CONFIDENCE: [high/medium/low]
+    async def _aextract_group(
+        self, previews: list[tuple[SourceMetadata, str]], sub_question: SubQuestion
+    ) -> list[Finding]:
+        """Extract findings from one group of (source, preview) pairs."""
+        formatted_sources = "\n\n".join(
+            f"[{source.id}] {source.title}\n{preview}" for source, preview in previews
+        )
 
----"""),
-            HumanMessage(content=f"Sources:\n{formatted_sources}\n\nExtract key findings:"),
+        messages = [
+            SystemMessage(content=FINDING_EXTRACTION_PROMPT),
+            HumanMessage(
+                content=f"Question: {sub_question.question}\n\n"
+                f"Sources:\n{formatted_sources}\n\nExtract key findings:"
+            ),
         ]
 
-        try:
-            response = self.llm.invoke(messages)
-
-            # Parse findings from structured response
-            findings_text = response.content
-            current_finding = {}
-
-            for line in findings_text.split("\n"):
-                line = line.strip()
-                if line.startswith("CLAIM:"):
-                    if current_finding.get("claim"):
-                        # Save previous finding
-                        all_findings.append(Finding(
-                            claim=current_finding.get("claim", ""),
-                            evidence=current_finding.get("evidence", ""),
-                            source_ids=current_finding.get("source_ids", []),
-                            confidence=current_finding.get("confidence", "medium"),
-                        ))
-                    current_finding = {"claim": line[6:].strip()}
-                elif line.startswith("EVIDENCE:"):
-                    current_finding["evidence"] = line[9:].strip()
-                elif line.startswith("SOURCE:"):
-                    src = line[7:].strip()
-                    current_finding["source_ids"] = [src] if src else []
-                elif line.startswith("CONFIDENCE:"):
-                    conf = line[11:].strip().lower()
-                    current_finding["confidence"] = conf if conf in ["high", "medium", "low"] else "medium"
-
-            # Don't forget the last finding
-            if current_finding.get("claim"):
-                all_findings.append(Finding(
-                    claim=current_finding.get("claim", ""),
-                    evidence=current_finding.get("evidence", ""),
-                    source_ids=current_finding.get("source_ids", []),
-                    confidence=current_finding.get("confidence", "medium"),
-                ))
-
-        except (KeyError, AttributeError, TypeError) as e:
-            print(f"Error extracting findings: {e}")
-            # Fallback: create basic findings from sources
-            for source in all_sources[:5]:
-                if source.full_content:
-                    all_findings.append(Finding(
-                        claim=source.title,
-                        evidence=source.full_content[:500],
-                        source_ids=[source.id],
-                        confidence="low",
-                    ))
-
-        return all_findings, all_sources
+        # Cached on the exact prompt, i.e. the question plus source contents
+        result = await acached_invoke(
+            self.cache, self.llm, messages, FindingsList, self.extractor_llm
+        )
+        for finding in result.findings:
+            finding.source_ids = [sid.strip("[] ") for sid in finding.source_ids]
+        return result.findings
 
     def synthesize_answer(
         self,
         sub_question: SubQuestion,
         findings: list[Finding],
         sources: list[SourceMetadata],
+    ) -> QuestionAnswer:
+        """Sync wrapper for asynthesize_answer."""
+        return run_async(self.asynthesize_answer(sub_question, findings, sources))
+
+    async def asynthesize_answer(
+        self,
+        sub_question: SubQuestion,
+        findings: list[Finding],
+        sources: list[SourceMetadata],
     ) -> QuestionAnswer:
         """
         Synthesize a comprehensive answer from findings.
@@ -273,40 +369,34 @@ CONFIDENCE: [high/medium/low]
                 completeness="insufficient",
             )
 
-        # Format findings for synthesis - INCLUDE source IDs for citations
+        # Format findings for synthesis - INCLUDE source IDs for citations.
+        # Canonical order, so the same findings always produce the same prompt bytes
+        # (prompt-cache hits on the continuation call and on reruns).
         findings_text = "\n\n".join(
             [
                 f"[{f.source_ids[0] if f.source_ids else 'unknown'}] Finding: {f.claim}\nEvidence: {f.evidence}\nConfidence: {f.confidence}"
-                for f in findings
+                for f in sorted(findings, key=_finding_sort_key)
             ]
         )
 
         # Synthesize answer
         messages = [
-            SystemMessage(content=ANSWER_SYNTHESIS_PROMPT),
+            _SYNTHESIS_SYSTEM_MESSAGE,
             HumanMessage(
                 content=f"Question: {sub_question.question}\n\n"
-                f"Research Findings ({len(findings)} total) - USE THESE [source_id] FOR CITATIONS:\n{findings_text}\n\n"
-                f"Write a COMPLETE, COMPREHENSIVE answer (500-1000 words) using ALL relevant findings above. "
-                f"**CRITICAL: Include [source_id] citations for EVERY factual claim.** "
-                f"Example: 'Player X averaged 30 points [src_abc123].' This is required."
+                f"Research Findings ({len(findings)} total) - USE THESE [source_id] FOR CITATIONS:\n{findings_text}"
             ),
         ]
 
-        response = self.llm.invoke(messages)
-        answer_text = response.content
+        answer_text, finish_reason = await _astream_text(self.synthesis_llm, messages)
 
-        # Validate answer isn't truncated
-        if len(answer_text) < 300 or answer_text.rstrip().endswith(('...', '—', '–')):
-            # Answer seems cut off, retry with explicit instruction
-            messages[-1] = HumanMessage(
-                content=f"Question: {sub_question.question}\n\n"
-                f"Research Findings ({len(findings)} total):\n{findings_text}\n\n"
-                f"IMPORTANT: Your previous response was too short or incomplete. "
-                f"Write a FULL answer of at least 500 words covering ALL the findings. Do not stop early."
+        # If the answer hit the token limit, ask for just the rest rather than a full rewrite
+        if finish_reason == "length":
+            print(f"[Researcher] {sub_question.question_id}: answer hit max_tokens, continuing")
+            rest, _ = await _astream_text(
+                self.synthesis_llm, [*messages, AIMessage(content=answer_text), _CONTINUE_MESSAGE]
             )
-            response = self.llm.invoke(messages)
-            answer_text = response.content
+            answer_text += rest
 
         # Assess overall confidence and completeness
         confidence = self._assess_confidence(findings, sources)
@@ -324,6 +414,12 @@ CONFIDENCE: [high/medium/low]
 
     def research_question(
         self, sub_question: SubQuestion, main_query: str
+    ) -> QuestionAnswer:
+        """Sync wrapper for aresearch_question."""
+        return run_async(self.aresearch_question(sub_question, main_query))
+
+    async def aresearch_question(
+        self, sub_question: SubQuestion, main_query: str
     ) -> QuestionAnswer:
         """
         Optimized research workflow: Search → Collect URLs → Extract ONCE → Synthesize.
@@ -340,14 +436,14 @@ CONFIDENCE: [high/medium/low]
         Returns:
             Complete QuestionAnswer with findings and sources
         """
-        # PHASE 1: Collect candidate URLs via cheap searches
-        queries = self.generate_search_queries(sub_question, main_query)
+        # PHASE 1: Collect candidate URLs via cheap searches. The planner writes
+        # queries for every sub-question in its one call; generate only if missing.
+        queries = sub_question.search_queries or await self.agenerate_search_queries(
+            sub_question, main_query
+        )
         
-        # Collect all results from 4 queries
-        all_results = []
-        for query in queries[:4]:  # 4 queries per question
-            results = self.search_tavily(query)
-            all_results.extend(results)
+        # Collect all results from 4 queries (4 queries per question)
+        all_results = await self._asearch_all(queries[:4])
         
         if not all_results:
             return QuestionAnswer(
@@ -360,26 +456,12 @@ CONFIDENCE: [high/medium/low]
                 completeness="insufficient",
             )
         
-        # Deduplicate by URL, keeping highest score
-        url_to_result = {}
-        for r in all_results:
-            url = r.get("url")
-            score = r.get("score", 0)
-            if url:
-                if url not in url_to_result or score > url_to_result[url].get("score", 0):
-                    url_to_result[url] = r
-        
-        # Sort by score and take top 10
-        sorted_results = sorted(
-            url_to_result.values(),
-            key=lambda x: x.get("score", 0),
-            reverse=True
-        )
-        all_search_results = sorted_results[:10]
+        # Deduplicate by URL (keeping highest score) and take top 10
+        all_search_results = self._dedup_and_topk(all_results)
         
         # PHASE 2: Extract full content from TOP 10 URLs (ONE API call)
         top_urls = [r["url"] for r in all_search_results if r.get("url")]
-        full_content = self.extract_full_content(top_urls)
+        full_content = await self.aextract_full_content(top_urls)
 
         # Enrich results with full content
         for result in all_search_results:
@@ -388,16 +470,37 @@ CONFIDENCE: [high/medium/low]
                 result["full_content"] = full_content[url]
 
         # PHASE 3: Extract findings from enriched results
-        all_findings, all_sources = self.extract_findings(all_search_results, sub_question)
+        all_findings, all_sources = await self.aextract_findings(all_search_results, sub_question)
 
         print(f"[Researcher] {sub_question.question_id}: {len(all_findings)} findings, {len(all_sources)} sources")
 
         # PHASE 4: Synthesize final answer
-        answer = self.synthesize_answer(sub_question, all_findings, all_sources)
+        answer = await self.asynthesize_answer(sub_question, all_findings, all_sources)
         return answer
 
     # Helper methods
 
+    @staticmethod
+    def _dedup_and_topk(results: list[dict], k: int = 10) -> list[dict]:
+        """Keep the best-scoring result per URL, then the top `k` by score."""
+        best: dict[str, dict] = {}
+        for r in results:
+            url = r.get("url")
+            if url and r.get("score", 0) > best.get(url, {}).get("score", -1):
+                best[url] = r
+        return heapq.nlargest(k, best.values(), key=lambda x: x.get("score", 0))
+
+    async def _asearch_all(self, queries: list[str], max_results: int | None = None) -> list[dict]:
+        """Run searches concurrently and concatenate results in query order."""
+        semaphore = asyncio.Semaphore(max(1, self.config.search_concurrency))
+
+        async def search(query: str) -> list[dict]:
+            async with semaphore:
+                return await self.asearch_tavily(query, max_results)
+
+        result_lists = await asyncio.gather(*(search(q) for q in queries))
+        return [r for results in result_lists for r in results]
+
     def _assess_confidence(
         self, findings: list[Finding], sources: list[SourceMetadata]
     ) -> str:
@@ -428,6 +531,19 @@ CONFIDENCE: [high/medium/low]
         improvement_suggestion: str,
         previous_sources: list[SourceMetadata] | None = None,
         suggested_searches: list[str] | None = None,
+    ) -> QuestionAnswer:
+        """Sync wrapper for aimprove_research."""
+        return run_async(self.aimprove_research(
+            sub_question, previous_answer, improvement_suggestion, previous_sources, suggested_searches
+        ))
+
+    async def aimprove_research(
+        self,
+        sub_question: SubQuestion,
+        previous_answer: str,
+        improvement_suggestion: str,
+        previous_sources: list[SourceMetadata] | None = None,
+        suggested_searches: list[str] | None = None,
     ) -> QuestionAnswer:
         """
         Improve research using reflection's suggested searches directly.
@@ -446,47 +562,30 @@ CONFIDENCE: [high/medium/low]
         print(f"[Researcher] {sub_question.question_id}: re-searching with {len(queries)} queries")
 
         # Collect all results
-        all_results = []
-        for query in queries:
-            results = self.search_tavily(query, max_results=5)
-            all_results.extend(results)
+        all_results = await self._asearch_all(queries, max_results=5)
 
         if not all_results:
             return self._make_answer(sub_question, previous_answer, [], [])
         
-        # Deduplicate by URL, keeping highest score
-        url_to_result = {}
-        for r in all_results:
-            url = r.get("url")
-            score = r.get("score", 0)
-            if url:
-                if url not in url_to_result or score > url_to_result[url].get("score", 0):
-                    url_to_result[url] = r
-        
-        # Sort by score and take top 10
-        sorted_results = sorted(
-            url_to_result.values(),
-            key=lambda x: x.get("score", 0),
-            reverse=True
-        )
-        top_results = sorted_results[:10]
+        # Deduplicate by URL (keeping highest score) and take top 10
+        top_results = self._dedup_and_topk(all_results)
 
         # Extract content from top URLs
         top_urls = [r["url"] for r in top_results if r.get("url")]
-        full_content = self.extract_full_content(top_urls)
+        full_content = await self.aextract_full_content(top_urls)
         for r in top_results:
             if r.get("url") in full_content:
                 r["full_content"] = full_content[r["url"]]
 
         # Extract findings
-        findings, sources = self.extract_findings(top_results, sub_question)
+        findings, sources = await self.aextract_findings(top_results, sub_question)
         print(f"[Researcher] {sub_question.question_id}: {len(findings)} new findings, {len(sources)} sources")
 
         if not findings:
             return self._make_answer(sub_question, previous_answer, [], previous_sources)
 
         # Synthesize improved answer
-        answer_text = self._synthesize_improved(
+        answer_text = await self._asynthesize_improved(
             sub_question, previous_answer, findings, improvement_suggestion
         )
 
@@ -515,7 +614,7 @@ CONFIDENCE: [high/medium/low]
             key_findings=findings,
         )
 
-    def _synthesize_improved(self, sq: SubQuestion, prev_answer: str, findings: list[Finding], gap: str) -> str:
+    async def _asynthesize_improved(self, sq: SubQuestion, prev_answer: str, findings: list[Finding], gap: str) -> str:
         """Synthesize an improved answer."""
         prompt = f"""Improve this answer by addressing the gap.
 
@@ -530,27 +629,29 @@ NEW FINDINGS:
 
 Write a complete, improved answer that addresses the gap. Include [source_id] citations:"""
 
-        response = self.llm.invoke([
-            SystemMessage(content=RESEARCHER_SYSTEM_PROMPT.format(date_context=get_current_date_context())),
+        response = await self.llm.ainvoke([
+            SystemMessage(content=get_researcher_system_prompt(get_current_date_context())),
             HumanMessage(content=prompt),
         ])
         return response.content
 
     def _merge_sources(self, new: list[SourceMetadata], prev: list) -> list[SourceMetadata]:
         """Merge new and previous sources, avoiding duplicates."""
-        all_sources = new.copy()
-        seen = {s.url for s in all_sources}
+        all_sources = []
+        seen = set()
 
-        for src in prev:
-            if isinstance(src, dict):
-                url = src.get("url", "")
-                if url and url not in seen:
-                    seen.add(url)
-                    all_sources.append(SourceMetadata(**src))
-            elif src.url not in seen:
+        for src in new:
+            if src.url not in seen:
                 seen.add(src.url)
                 all_sources.append(src)
 
+        for src in prev:
+            is_dict = isinstance(src, dict)
+            url = src.get("url", "") if is_dict else src.url
+            if url and url not in seen:
+                seen.add(url)
+                all_sources.append(SourceMetadata(**src) if is_dict else src)
+
         return all_sources
 
     def _format_findings_for_synthesis(self, findings: list[Finding]) -> str:
@@ -562,6 +663,10 @@ Write a complete, improved answer that addresses the gap. Include [source_id] ci
         return "\n".join(parts)
 
     def compress_research(self, answer: QuestionAnswer, sub_question: SubQuestion) -> str:
+        """Sync wrapper for acompress_research."""
+        return run_async(self.acompress_research(answer, sub_question))
+
+    async def acompress_research(self, answer: QuestionAnswer, sub_question: SubQuestion) -> str:
         """Compress research findings for compiler."""
         if not answer.sources:
             return f"## {sub_question.question}\n\nNo sources found.\n"
@@ -570,7 +675,7 @@ Write a complete, improved answer that addresses the gap. Include [source_id] ci
             context = self._build_compression_context(
                 answer, sub_question, self.config.chars_per_source
             )
-            response = self.llm.invoke([
+            response = await self.llm.ainvoke([
                 SystemMessage(content=COMPRESS_RESEARCH_PROMPT),
                 HumanMessage(content=context),
             ])
@@ -609,8 +714,14 @@ def researcher_node(state: ResearchState, config: RunnableConfig | None = None)
     - Improvement (has previous_answer + improvement_suggestion)
 
     Returns:
-        Updates to question_answers and compressed_findings for this question.
+        Updates to question_answers for this question, and a compressed_findings
+        placeholder that compress_node fills in.
     """
+    return run_async(aresearcher_node(state, config))
+
+
+async def aresearcher_node(state: ResearchState, config: RunnableConfig | None = None) -> dict:
+    """Async researcher_node, awaited directly by the graph's async runtime."""
     # Get sub_question (may be dict from Send)
     sq = state.get("sub_question")
     if not sq:
@@ -636,18 +747,43 @@ def researcher_node(state: ResearchState, config: RunnableConfig | None = None)
 
     if prev_answer and suggestion:
         # IMPROVEMENT: Re-research with suggested_searches
-        answer = researcher.improve_research(
+        answer = await researcher.aimprove_research(
             sq, prev_answer, suggestion, prev_sources, suggested_searches
         )
     else:
         # INITIAL: Fresh research
-        answer = researcher.research_question(sq, main_query)
-
-    # Compress for report
-    compressed = researcher.compress_research(answer, sq)
+        answer = await researcher.aresearch_question(sq, main_query)
 
+    # Compression happens in compress_node, alongside reflection
     return {
         "question_answers": {sq.question_id: answer},
-        "compressed_findings": {sq.question_id: compressed},
+        "compressed_findings": {sq.question_id: None},
     }
 
+
+def compress_node(state: ResearchState, config: RunnableConfig | None = None) -> dict:
+    """
+    LangGraph node: Compress newly researched answers for the compiler.
+
+    Runs in parallel with reflection, which only reads the raw answers, so the
+    compression call is off each researcher's critical path. Answers awaiting
+    compression have a None placeholder in compressed_findings.
+    """
+    return run_async(acompress_node(state, config))
+
+
+async def acompress_node(state: ResearchState, config: RunnableConfig | None = None) -> dict:
+    """Async compress_node; compresses all pending answers concurrently."""
+    pending = [q_id for q_id, text in state.get("compressed_findings", {}).items() if text is None]
+    if not pending:
+        return {}
+
+    researcher = Researcher(config=get_config(config or {}))
+    sq_map = {sq.question_id: sq for sq in as_research_plan(state["research_plan"]).sub_questions}
+    answers = state["question_answers"]
+
+    compressed = await asyncio.gather(*(
+        researcher.acompress_research(answers[q_id], sq_map[q_id]) for q_id in pending
+    ))
+    return {"compressed_findings": dict(zip(pending, compressed))}
+
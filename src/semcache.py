@@ -0,0 +1,132 @@
+"""
+Similarity cache for generated report sections.
+
+A section is keyed on its plan (title, focus, key points, style, audience) and a
+digest of the findings it was written from. Lookups return a stored section
+written from the same findings, with the same title, whose plan is near-identical
+to the requested one, so re-running a topic reuses sections even when the report
+planner words their focus or key points slightly differently.
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+from functools import lru_cache
+from pathlib import Path
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def _tokens(text: str) -> frozenset[str]:
+    return frozenset(_TOKEN_RE.findall(text.lower()))
+
+
+def _title(spec: str) -> str:
+    """Section title, the first line of a spec."""
+    return spec.split("\n", 1)[0].strip().lower()
+
+
+def findings_digest(*parts: str) -> str:
+    """Digest of everything a section's content depends on besides its plan."""
+    return hashlib.sha1("\x00".join(parts).encode()).hexdigest()
+
+
+class SectionCache:
+    """
+    Section text cache persisted as JSONL.
+
+    Exact plan matches are a dict lookup; otherwise candidates with the same
+    findings digest and title are compared by token-set Jaccard similarity.
+    Titles must match exactly because specs differing only in a subject name
+    (e.g. two players) still score high on the shared words.
+
+    The file is capped at `max_entries` sections: once it grows past that, it is
+    rewritten keeping the newest three quarters.
+    """
+
+    def __init__(self, root: str, threshold: float = 0.95, max_entries: int = 2000):
+        self.path = Path(root).expanduser() / "sections.jsonl"
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: list[dict[str, str]] = []
+        self._exact: dict[tuple[str, str], str] = {}
+        self._candidates: dict[tuple[str, str], list[tuple[frozenset[str], str]]] = {}
+        self._load()
+
+    def get(self, digest: str, spec: str) -> str | None:
+        """Return a cached section for this plan, or None on a miss."""
+        hit = self._exact.get((digest, spec))
+        if hit is not None:
+            return hit
+
+        query = _tokens(spec)
+        best_score, best_text = 0.0, None
+        for tokens, text in self._candidates.get((digest, _title(spec)), []):
+            score = len(query & tokens) / (len(query | tokens) or 1)
+            if score > best_score:
+                best_score, best_text = score, text
+        return best_text if best_score >= self.threshold else None
+
+    def put(self, digest: str, spec: str, text: str) -> None:
+        """Store a generated section and append it to the JSONL file."""
+        entry = {"digest": digest, "spec": spec, "text": text}
+        with self._lock:
+            self._entries.append(entry)
+            if len(self._entries) > self.max_entries:
+                self._compact()
+                return
+            self._remember(entry)
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with self.path.open("a", encoding="utf-8") as f:
+                    f.write(json.dumps(entry) + "\n")
+            except OSError as e:
+                print(f"[SectionCache] Could not persist section: {e}")
+
+    def _remember(self, entry: dict[str, str]) -> None:
+        digest, spec = entry["digest"], entry["spec"]
+        self._exact[(digest, spec)] = entry["text"]
+        self._candidates.setdefault((digest, _title(spec)), []).append((_tokens(spec), entry["text"]))
+
+    def _compact(self) -> None:
+        """Keep the newest entries, rebuild the indexes and rewrite the file."""
+        self._entries = self._entries[-(self.max_entries * 3 // 4):]
+        self._exact.clear()
+        self._candidates.clear()
+        for entry in self._entries:
+            self._remember(entry)
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.writelines(json.dumps(entry) + "\n" for entry in self._entries)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"[SectionCache] Could not rewrite {self.path.name}: {e}")
+
+    def _load(self) -> None:
+        try:
+            lines = self.path.read_text(encoding="utf-8").splitlines()
+        except OSError:
+            return
+        for line in lines:
+            try:
+                entry = json.loads(line)
+                self._entries.append({k: entry[k] for k in ("digest", "spec", "text")})
+            except (ValueError, KeyError, TypeError):
+                continue  # Skip partially written lines
+        if len(self._entries) > self.max_entries:
+            self._compact()
+        else:
+            for entry in self._entries:
+                self._remember(entry)
+
+
+@lru_cache(maxsize=4)
+def get_section_cache(root: str) -> SectionCache:
+    """Return the process-wide SectionCache for `root`, so the file is read once."""
+    return SectionCache(root)
@@ -22,8 +22,8 @@ def merge_question_answers(
 
 
 def merge_compressed_findings(
-    existing: dict[str, str], new: dict[str, str]
-) -> dict[str, str]:
+    existing: dict[str, str | None], new: dict[str, str | None]
+) -> dict[str, str | None]:
     """Reducer: merge compressed findings from parallel researchers."""
     merged = existing.copy() if existing else {}
     if new:
@@ -31,6 +31,30 @@ def merge_compressed_findings(
     return merged
 
 
+def as_research_plan(plan: "ResearchPlan | dict | None") -> Optional["ResearchPlan"]:
+    """
+    Return the plan as a ResearchPlan.
+
+    The planner stores a model, but a plan passed in the graph input or restored
+    from a serialized checkpoint arrives as a plain dict.
+    """
+    if plan is None or isinstance(plan, ResearchPlan):
+        return plan
+    return ResearchPlan.model_validate(plan)
+
+
+def merge_research_plan(
+    existing: Optional["ResearchPlan"], new: "ResearchPlan | dict | None"
+) -> Optional["ResearchPlan"]:
+    """
+    Reducer: keep the latest plan, validating dict updates.
+
+    LangGraph stores a channel's first write as-is and doesn't run reducers when
+    restoring a checkpoint, so readers still go through as_research_plan.
+    """
+    return as_research_plan(new)
+
+
 class ReportPreferences(BaseModel):
     """User's preferences for the report, parsed from natural language."""
     research_question: str = Field(description="The core research question to answer")
@@ -49,9 +73,9 @@ class ResearchState(TypedDict):
     # Parsed from user's natural language request
     report_preferences: NotRequired[Optional["ReportPreferences"]]
 
-    research_plan: NotRequired[Optional["ResearchPlan"]]
+    research_plan: NotRequired[Annotated[Optional["ResearchPlan"], merge_research_plan]]
     question_answers: NotRequired[Annotated[dict[str, "QuestionAnswer"], merge_question_answers]]
-    compressed_findings: NotRequired[Annotated[dict[str, str], merge_compressed_findings]]
+    compressed_findings: NotRequired[Annotated[dict[str, str | None], merge_compressed_findings]]  # None = awaiting compression
     current_iteration: NotRequired[int]  # Tracks re-research iterations (max 2)
     agent_analysis: NotRequired[Optional["AgentAnalysis"]]
     final_report: NotRequired[str]
@@ -68,6 +92,10 @@ class SubQuestion(BaseModel):
     question: str
     search_strategy: str
     importance: str  # critical, important, supporting
+    search_queries: list[str] = Field(
+        default_factory=list,
+        description="3-4 specific web search queries for this question",
+    )
 
 
 class ResearchPlan(BaseModel):
@@ -95,6 +123,11 @@ class Finding(BaseModel):
     confidence: str  # high, medium, low
 
 
+class FindingsList(BaseModel):
+    """Findings extracted from a batch of sources."""
+    findings: list[Finding] = Field(description="3-6 specific, factual findings")
+
+
 class QuestionAnswer(BaseModel):
     """Structured answer to a sub-question."""
     question_id: str